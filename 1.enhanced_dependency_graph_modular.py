@@ -8,14 +8,26 @@ This replaces the monolithic enhanced_dependency_graph.py with a clean,
 maintainable modular architecture.
 
 Usage:
-    python enhanced_dependency_graph_modular.py [root_path]
+    python enhanced_dependency_graph_modular.py [--no-cache] [--jobs N] [root_path]
 
     root_path: Path to the root directory to analyze (optional, defaults to parent directory)
+    --no-cache: Regenerate even if a cached result for the same inputs exists
+    --jobs N: Parse files in N worker processes (default: one per core, 1 for serial)
     Examples:
         python enhanced_dependency_graph_modular.py
         python enhanced_dependency_graph_modular.py "C:/path/to/project"
         python enhanced_dependency_graph_modular.py "/home/user/project"
 
+Generated files are cached in the temp directory, keyed by the graph_modules
+sources, the size/mtime of every analyzed Python file under root_path, the
+project's git HEAD and the start of the git analysis window, so an
+unchanged project is copied into graph_output/ without being re-analyzed.
+When the project has changed, only files whose size or mtime differ are
+parsed again, and git history is only re-read when HEAD has moved.
+--no-cache bypasses all of these caches and refreshes the cached output.
+Keep bytecode caching on (e.g. python -X pycache_prefix=...) so the
+graph_modules package itself is not recompiled on each run.
+
 The original enhanced_dependency_graph.py has been split into focused modules:
 - dependency_analyzer.py: Core analysis logic
 - graph_styles.py: CSS styling
@@ -29,20 +41,61 @@ Author: Enhanced Dependency Graph System
 Date: 2025-07-22
 """
 
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 # USER CONFIGURABLE ROOT DIRECTORY
 # Change this path to analyze a different project:
 DEFAULT_ROOT_PATH = r"C:\Users\dea29431.RSKGAD\OneDrive - Rsk Group Limited\Documents\Geotech\AGS Section\Geo_Borehole_Sections_Render"
 
+# Generated files that are cached between runs
+OUTPUT_FILES = ("enhanced_graph_data.json", "enhanced_dependency_graph.html")
+CACHE_DIR = Path(tempfile.gettempdir()) / "depgraph-cache"
+
+# Keep writing __pycache__ so the graph_modules package loads from bytecode
+sys.dont_write_bytecode = False
+
 # Fall back to current directory context (when run from dependency_graph/)
 from graph_modules import main
+from graph_modules.html_generator import compute_input_digest, get_output_dir
+
+
+def restore_cached_output(cache_key):
+    """Copy a cached result into graph_output; return True on a cache hit"""
+    cached = [CACHE_DIR / f"{cache_key}-{name}" for name in OUTPUT_FILES]
+    if not all(path.exists() for path in cached):
+        return False
+
+    output_dir = get_output_dir()
+    for path, name in zip(cached, OUTPUT_FILES):
+        shutil.copyfile(path, output_dir / name)
+    return True
+
+
+def store_cached_output(cache_key):
+    """Copy the freshly generated files into the cache"""
+    CACHE_DIR.mkdir(exist_ok=True)
+    output_dir = get_output_dir()
+    for name in OUTPUT_FILES:
+        shutil.copyfile(output_dir / name, CACHE_DIR / f"{cache_key}-{name}")
+
 
 if __name__ == "__main__":
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args
+    args = [arg for arg in args if arg != "--no-cache"]
+
+    jobs = None
+    if "--jobs" in args:
+        position = args.index("--jobs")
+        jobs = int(args[position + 1])
+        del args[position : position + 2]
+
     # Get root path from command line argument or use default
-    if len(sys.argv) > 1:
-        root_path = sys.argv[1]
+    if args:
+        root_path = args[0]
         print(f"📁 Using command-line root path: {root_path}")
     else:
         root_path = DEFAULT_ROOT_PATH
@@ -51,8 +104,18 @@ if __name__ == "__main__":
     # Validate root path exists
     if not Path(root_path).exists():
         print(f"❌ Error: Root path does not exist: {root_path}")
-        print("💡 Usage: python enhanced_dependency_graph_modular.py [root_path]")
+        print(
+            "💡 Usage: python enhanced_dependency_graph_modular.py [--no-cache] [--jobs N] [root_path]"
+        )
         sys.exit(1)
 
+    # --no-cache skips the lookup but still refreshes the cached entry
+    cache_key = compute_input_digest(root_path)
+    if use_cache and restore_cached_output(cache_key):
+        print("⚡ Inputs unchanged - restored cached graph output")
+        sys.exit(0)
+
     # Run main with custom root path
-    main(root_path)
+    main(root_path, jobs=jobs, use_cache=use_cache)
+
+    store_cached_output(cache_key)
@@ -4,8 +4,123 @@ Project Analysis Script - Determine Actual Filter Maximums
 """
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 
+try:
+    import ijson  # Optional: stream large graph files instead of loading them
+except ImportError:
+    ijson = None
+
+try:
+    import numpy as np  # Optional: count edge degrees in C for large graphs
+except ImportError:
+    np = None
+
+
+def summarize_nodes(nodes):
+    """Return (node_count, max_size_kb, long_names) for an iterable of nodes.
+
+    long_names holds (length, stem) for every stem longer than 10 characters.
+    """
+    node_count = 0
+    max_size_kb = 0
+    long_names = []
+    for node in nodes:
+        node_count += 1
+        max_size_kb = max(max_size_kb, node.get("size_kb", 0))
+        if len(stem := node.get("stem", "")) > 10:
+            long_names.append((len(stem), stem))
+    return node_count, max_size_kb, long_names
+
+
+def stream_graph_summary(graph_data_path):
+    """Summarize the graph file in one ijson event pass.
+
+    Only the running maxima, the long stems and the per-node degree counters
+    are kept, so no node or edge dict is ever built and the dependency, git
+    and statistics sections are skipped as they stream past.
+    """
+    node_count = 0
+    max_size_kb = 0
+    long_names = []
+    edge_count = 0
+    predecessor_counts = Counter()
+    successor_counts = Counter()
+
+    with open(graph_data_path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "nodes.item":
+                if event == "start_map":
+                    node_count += 1
+            elif prefix == "nodes.item.size_kb":
+                max_size_kb = max(max_size_kb, value)
+            elif prefix == "nodes.item.stem":
+                if len(value) > 10:
+                    long_names.append((len(value), value))
+            elif prefix == "edges.item":
+                if event == "start_map":
+                    edge_count += 1
+            elif prefix == "edges.item.source":
+                successor_counts[value] += 1
+            elif prefix == "edges.item.target":
+                predecessor_counts[value] += 1
+
+    return {
+        "total_nodes": node_count,
+        "total_edges": edge_count,
+        "max_predecessors": max(predecessor_counts.values(), default=0),
+        "max_successors": max(successor_counts.values(), default=0),
+        "max_size_kb": max_size_kb,
+        "long_names": long_names,
+    }
+
+
+def load_graph_summary(graph_data_path):
+    """Return node/edge totals, degree and size maxima and long stems.
+
+    With ijson installed the file is streamed (see stream_graph_summary).
+    Otherwise the whole file is parsed with the json module and edges are
+    reduced to (source, target) pairs for max_edge_degrees.
+    """
+    if ijson is not None:
+        return stream_graph_summary(graph_data_path)
+
+    with open(graph_data_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    node_count, max_size_kb, long_names = summarize_nodes(data.get("nodes", []))
+    edges = [(edge["source"], edge["target"]) for edge in data.get("edges", [])]
+    max_predecessors, max_successors = max_edge_degrees(edges)
+    return {
+        "total_nodes": node_count,
+        "total_edges": len(edges),
+        "max_predecessors": max_predecessors,
+        "max_successors": max_successors,
+        "max_size_kb": max_size_kb,
+        "long_names": long_names,
+    }
+
+
+def max_edge_degrees(edges):
+    """Return (max_predecessors, max_successors) for (source, target) pairs.
+
+    Node indices are small non-negative integers, so with numpy available the
+    in- and out-degrees are counted with np.bincount; otherwise a Counter
+    pass over the pairs is used.
+    """
+    if not edges:
+        return 0, 0
+
+    if np is not None:
+        pairs = np.array(edges, dtype=np.int64)
+        in_degree = np.bincount(pairs[:, 1])
+        out_degree = np.bincount(pairs[:, 0])
+        return int(in_degree.max()), int(out_degree.max())
+
+    predecessor_counts = Counter(target for _, target in edges)
+    successor_counts = Counter(source for source, _ in edges)
+    return max(predecessor_counts.values()), max(successor_counts.values())
+
 
 def analyze_project_maximums():
     """Analyze the current project to determine actual filter maximums"""
@@ -17,73 +132,44 @@ def analyze_project_maximums():
             print("❌ Graph data not found. Run the dependency graph generator first.")
             return None
 
-        with open(graph_data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        nodes = data.get("nodes", [])
-        if not nodes:
+        summary = load_graph_summary(graph_data_path)
+        if not summary["total_nodes"]:
             print("❌ No nodes found in graph data")
             return None
 
-        # Calculate actual maximums
-        max_predecessors = 0
-        max_successors = 0
-        max_size_kb = 0
-
-        for node in nodes:
-            # Count predecessors (incoming edges)
-            predecessors = len(
-                [
-                    edge
-                    for edge in data.get("edges", [])
-                    if edge["target"] == node["index"]
-                ]
-            )
-            max_predecessors = max(max_predecessors, predecessors)
-
-            # Count successors (outgoing edges)
-            successors = len(
-                [
-                    edge
-                    for edge in data.get("edges", [])
-                    if edge["source"] == node["index"]
-                ]
-            )
-            max_successors = max(max_successors, successors)
-
-            # File size in KB
-            size_kb = node.get("size_kb", 0)
-            max_size_kb = max(max_size_kb, size_kb)
-
         result = {
-            "max_predecessors": max_predecessors,
-            "max_successors": max_successors,
-            "max_size_kb": int(max_size_kb),
-            "total_nodes": len(nodes),
-            "total_edges": len(data.get("edges", [])),
+            "max_predecessors": summary["max_predecessors"],
+            "max_successors": summary["max_successors"],
+            "max_size_kb": int(summary["max_size_kb"]),
+            "total_nodes": summary["total_nodes"],
+            "total_edges": summary["total_edges"],
         }
 
-        print("📊 PROJECT ANALYSIS RESULTS")
-        print("=" * 40)
-        print(f"📁 Total files analyzed: {result['total_nodes']}")
-        print(f"🔗 Total dependencies: {result['total_edges']}")
-        print(f"📥 Maximum predecessors: {result['max_predecessors']}")
-        print(f"📤 Maximum successors: {result['max_successors']}")
-        print(f"📄 Maximum file size: {result['max_size_kb']} KB")
-        print()
-        print("🎯 RECOMMENDED FILTER MAXIMUMS:")
-        print(f"   Predecessors: {result['max_predecessors']}")
-        print(f"   Successors: {result['max_successors']}")
-        print(f"   File Size: {result['max_size_kb']} KB")
+        report = []
+        emit = report.append
+
+        emit("📊 PROJECT ANALYSIS RESULTS")
+        emit("=" * 40)
+        emit(f"📁 Total files analyzed: {result['total_nodes']}")
+        emit(f"🔗 Total dependencies: {result['total_edges']}")
+        emit(f"📥 Maximum predecessors: {result['max_predecessors']}")
+        emit(f"📤 Maximum successors: {result['max_successors']}")
+        emit(f"📄 Maximum file size: {result['max_size_kb']} KB")
+        emit("")
+        emit("🎯 RECOMMENDED FILTER MAXIMUMS:")
+        emit(f"   Predecessors: {result['max_predecessors']}")
+        emit(f"   Successors: {result['max_successors']}")
+        emit(f"   File Size: {result['max_size_kb']} KB")
 
         # Also analyze node names for truncation issues
-        long_names = [node for node in nodes if len(node.get("stem", "")) > 10]
+        long_names = summary["long_names"]
         if long_names:
-            print(f"\n📝 LONG NODE NAMES ({len(long_names)} files):")
-            for node in sorted(
-                long_names, key=lambda x: len(x.get("stem", "")), reverse=True
-            )[:5]:
-                print(f"   {len(node.get('stem', ''))}: {node.get('stem', '')}")
+            emit(f"\n📝 LONG NODE NAMES ({len(long_names)} files):")
+            long_names.sort(key=lambda item: item[0], reverse=True)
+            for length, stem in long_names[:5]:
+                emit(f"   {length}: {stem}")
+
+        sys.stdout.write("\n".join(report) + "\n")
 
         return result
 
@@ -14,272 +14,461 @@ This script creates a comprehensive analysis of the codebase structure.
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import ast
 
+try:
+    import ahocorasick  # Optional: pyahocorasick multi-pattern automaton
+except ImportError:
+    ahocorasick = None
+
+# File types tracked by the analysis phases, with their report labels
+FILE_TYPES = {".py": "python", ".html": "html", ".js": "javascript", ".css": "css"}
+
+# File types whose text content is scanned by the analysis phases
+SCANNED_SUFFIXES = (".py", ".js", ".css")
+
+# Directories never worth descending into (caches, VCS data, environments,
+# generated output and archived copies)
+SKIP_DIRS = {
+    "__pycache__",
+    ".git",
+    ".venv",
+    "venv",
+    "node_modules",
+    "archived_duplicates",
+    "graph_output",
+}
+
+# Worker threads used to overlap file reads
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files shorter than this cannot hold meaningful CSS/JS and are not scanned
+MIN_SCAN_LENGTH = 64
+
+# Files larger than this are generated blobs or dumps and are never read
+MAX_SCAN_BYTES = 2 * 1024 * 1024
+
+# Precompiled patterns shared by the analysis phases
+DUPLICATE_SUFFIX_RE = re.compile(r"_(new|backup|old)$")
+
+# Key CSS patterns as (display name, compiled pattern). Sources are scanned
+# as raw bytes, so every content pattern below is a bytes pattern.
+KEY_CSS_PATTERNS = [
+    (name, re.compile(pattern, re.DOTALL | re.IGNORECASE))
+    for name, pattern in [
+        ("node", rb"\.node[^{]*\{[^}]*\}"),
+        ("link", rb"\.link[^{]*\{[^}]*\}"),
+        ("tooltip", rb"\.tooltip[^{]*\{[^}]*\}"),
+        ("path-highlighted", rb"path-highlighted[^{]*\{[^}]*\}"),
+        ("dimmed", rb"dimmed[^{]*\{[^}]*\}"),
+        ("orange", rb"orange[^{]*\{[^}]*\}"),
+        ("blue", rb"blue[^{]*\{[^}]*\}"),
+    ]
+]
+
+# Selectors marking a Python file as carrying embedded CSS
+CSS_SELECTORS = (b".node", b".link", b".tooltip", b"path-highlighted")
+
+# Keywords marking a Python file as carrying embedded JavaScript
+JS_KEYWORDS = (b"d3.", b"function", b"addEventListener", b"querySelector")
+
+
+def compile_keyword_scanner(keywords):
+    """Build a function counting each keyword's occurrences in a bytes source.
+
+    With pyahocorasick installed one automaton pass finds every keyword;
+    the source is decoded as latin-1, which maps each byte to one
+    character, so matches line up with the bytes. Otherwise each keyword
+    is counted with bytes.count, a C-level scan per keyword. The result is
+    a Counter keyed by the encoded keywords, holding only those present.
+    """
+    keywords = [keyword.encode() for keyword in keywords]
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword.decode("latin-1"), keyword)
+        automaton.make_automaton()
+        return lambda content: Counter(
+            keyword for _, keyword in automaton.iter(content.decode("latin-1"))
+        )
+
+    def scan(content):
+        counts = Counter()
+        for keyword in keywords:
+            if keyword in content:
+                counts[keyword] = content.count(keyword)
+        return counts
+
+    return scan
+
+
+# Key interaction patterns analyzed in Phase 3
+INTERACTION_KEYWORDS = [
+    "path-highlighted",
+    "dimmed",
+    "tooltip",
+    "orange",
+    "blue",
+    "addEventListener",
+    "classList.add",
+    "classList.remove",
+    "style.opacity",
+    "d3.select",
+]
+count_interaction_keywords = compile_keyword_scanner(INTERACTION_KEYWORDS)
+
+# Keywords used to classify files in Phase 4, matched against lowercased text
+count_issue_keywords = compile_keyword_scanner(
+    [
+        "blue",
+        "orange",
+        "edge",
+        "dimmed",
+        "link",
+        "tooltip",
+        "horizontal",
+        "position",
+        "left",
+    ]
+)
+
+
+def flush_report(lines):
+    """Write buffered report lines to stdout with a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def iter_project_entries(root_path):
+    """Yield a DirEntry for every file under root_path.
+
+    Directories in SKIP_DIRS and hidden folders are pruned before they are
+    opened, and directories that cannot be read are skipped. Entries carry
+    the metadata returned by the directory scan.
+    """
+    pending = [root_path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS and not entry.name.startswith("."):
+                    subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+        # Reverse so directories are visited in listing order
+        pending.extend(reversed(subdirs))
+
+
+def read_source(file_path):
+    """Read a file as raw bytes, returning None if it cannot be read.
 
-def analyze_project_structure():
+    Every scan matches ASCII keywords and patterns, so sources are never
+    decoded; only matched snippets are turned into text.
+    """
+    try:
+        return file_path.read_bytes()
+    except OSError:
+        return None
+
+
+def is_worth_reading(entry, suffix):
+    """Decide from the file size alone whether a scanned file needs reading.
+
+    Python files are kept down to a single byte because Phase 5 parses them
+    for function definitions; CSS and JS files are only keyword scanned.
+    """
+    size = entry.stat().st_size
+    min_size = 1 if suffix == ".py" else MIN_SCAN_LENGTH
+    return min_size <= size <= MAX_SCAN_BYTES
+
+
+def collect_corpus(root_path):
+    """Walk the project once, caching file lists and raw sources.
+
+    Every analysis phase works from the returned corpus instead of walking
+    the tree and re-reading each file on its own.
+    """
+    files = {suffix: [] for suffix in FILE_TYPES}
+    scanned_files = []
+    for entry in iter_project_entries(root_path):
+        suffix = os.path.splitext(entry.name)[1]
+        if suffix not in files:
+            continue
+        file_path = Path(entry.path)
+        files[suffix].append(file_path)
+        if suffix in SCANNED_SUFFIXES and is_worth_reading(entry, suffix):
+            scanned_files.append(file_path)
+
+    # File reads release the GIL, so a thread pool overlaps the disk I/O
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        contents = executor.map(read_source, scanned_files)
+        sources = {
+            path: content
+            for path, content in zip(scanned_files, contents)
+            if content is not None
+        }
+
+    return {"files": files, "sources": sources, "trees": {}}
+
+
+def get_syntax_tree(corpus, file_path):
+    """Return the parsed AST for a Python source, caching it in the corpus.
+
+    Returns None for files that are unreadable or fail to parse.
+    """
+    trees = corpus["trees"]
+    if file_path not in trees:
+        try:
+            trees[file_path] = ast.parse(
+                corpus["sources"][file_path], filename=str(file_path)
+            )
+        except (KeyError, SyntaxError, ValueError):
+            trees[file_path] = None
+    return trees[file_path]
+
+
+class FunctionNameCollector(ast.NodeVisitor):
+    """Collect the names of all (async) function definitions in a tree."""
+
+    def __init__(self):
+        self.names = []
+
+    def visit_FunctionDef(self, node):
+        self.names.append(node.name)
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+
+def analyze_project_structure(corpus):
     """Phase 1: Detailed structure analysis"""
-    print("🔍 PHASE 1: COMPREHENSIVE PROJECT STRUCTURE ANALYSIS")
-    print("=" * 80)
+    report = []
+    emit = report.append
+
+    emit("🔍 PHASE 1: COMPREHENSIVE PROJECT STRUCTURE ANALYSIS")
+    emit("=" * 80)
 
     root_path = Path(".")
+    files = corpus["files"]
 
     # 1. File Organization Analysis
-    print("\n📁 FILE ORGANIZATION ANALYSIS:")
+    emit("\n📁 FILE ORGANIZATION ANALYSIS:")
 
-    # Count different file types
-    file_counts = defaultdict(int)
+    # Count different file types (already bucketed by suffix in the corpus)
+    file_counts = Counter(
+        {label: len(files[suffix]) for suffix, label in FILE_TYPES.items()}
+    )
     duplicate_patterns = defaultdict(list)
 
-    for file_path in root_path.rglob("*.py"):
-        file_counts["python"] += 1
-
+    for file_path in files[".py"]:
         # Check for duplicate patterns (_new, _backup, etc.)
         stem = file_path.stem
         if stem.endswith(("_new", "_backup", "_old")):
-            base_name = re.sub(r"_(new|backup|old)$", "", stem)
+            base_name = DUPLICATE_SUFFIX_RE.sub("", stem)
             duplicate_patterns[base_name].append(str(file_path))
 
-    for file_path in root_path.rglob("*.html"):
-        file_counts["html"] += 1
-
-    for file_path in root_path.rglob("*.js"):
-        file_counts["javascript"] += 1
-
-    for file_path in root_path.rglob("*.css"):
-        file_counts["css"] += 1
-
-    print(f"   📊 Total Python files: {file_counts['python']}")
-    print(f"   📊 Total HTML files: {file_counts['html']}")
-    print(f"   📊 Total JS files: {file_counts['javascript']}")
-    print(f"   📊 Total CSS files: {file_counts['css']}")
+    emit(f"   📊 Total Python files: {file_counts['python']}")
+    emit(f"   📊 Total HTML files: {file_counts['html']}")
+    emit(f"   📊 Total JS files: {file_counts['javascript']}")
+    emit(f"   📊 Total CSS files: {file_counts['css']}")
 
     # 2. Duplicate File Analysis
-    print(f"\n🔄 DUPLICATE FILE PATTERNS DETECTED:")
+    emit(f"\n🔄 DUPLICATE FILE PATTERNS DETECTED:")
     for base_name, files in duplicate_patterns.items():
         if len(files) > 1:
-            print(f"   ⚠️ {base_name}: {len(files)} versions")
+            emit(f"   ⚠️ {base_name}: {len(files)} versions")
             for file in files:
-                print(f"      - {file}")
+                emit(f"      - {file}")
 
     # 3. Module Structure Analysis
-    print(f"\n🏗️ MODULE STRUCTURE ANALYSIS:")
+    emit(f"\n🏗️ MODULE STRUCTURE ANALYSIS:")
 
     graph_modules_path = root_path / "graph_modules"
     if graph_modules_path.exists():
-        print(f"   📦 graph_modules package structure:")
+        emit(f"   📦 graph_modules package structure:")
 
         for item in graph_modules_path.iterdir():
             if item.is_dir() and item.name != "__pycache__":
-                print(f"      📁 {item.name}/")
+                emit(f"      📁 {item.name}/")
                 for subitem in item.iterdir():
                     if subitem.is_file() and subitem.suffix == ".py":
-                        print(f"         📄 {subitem.name}")
+                        emit(f"         📄 {subitem.name}")
             elif item.is_file() and item.suffix == ".py":
-                print(f"      📄 {item.name}")
+                emit(f"      📄 {item.name}")
 
+    flush_report(report)
     return duplicate_patterns
 
 
-def analyze_css_styles():
+def analyze_css_styles(corpus):
     """Phase 2: CSS style consistency analysis"""
-    print("\n🎨 PHASE 2: CSS STYLE CONSISTENCY ANALYSIS")
-    print("=" * 80)
+    report = []
+    emit = report.append
+
+    emit("\n🎨 PHASE 2: CSS STYLE CONSISTENCY ANALYSIS")
+    emit("=" * 80)
 
-    css_files = []
+    sources = corpus["sources"]
     style_definitions = defaultdict(list)
 
     # Find all CSS content (both .css files and embedded in Python)
-    root_path = Path(".")
-
-    # Check .css files
-    for css_file in root_path.rglob("*.css"):
-        css_files.append(css_file)
+    css_files = list(corpus["files"][".css"])
 
     # Check Python files for embedded CSS
     python_css_files = []
-    for py_file in root_path.rglob("*.py"):
-        try:
-            content = py_file.read_text(encoding="utf-8")
-            if "css" in content.lower() and any(
-                selector in content
-                for selector in [".node", ".link", ".tooltip", "path-highlighted"]
-            ):
-                python_css_files.append(py_file)
-        except Exception as e:
+    for py_file in corpus["files"][".py"]:
+        content = sources.get(py_file)
+        if content is None or len(content) < MIN_SCAN_LENGTH:
             continue
+        # Cheap case-sensitive selector test first; lowercase only on a hit
+        if any(selector in content for selector in CSS_SELECTORS) and (
+            b"css" in content.lower()
+        ):
+            python_css_files.append(py_file)
 
-    print(f"   📊 Found {len(css_files)} dedicated CSS files")
-    print(f"   📊 Found {len(python_css_files)} Python files with CSS content")
-
-    # Analyze key style patterns
-    key_patterns = [
-        r"\.node[^{]*\{[^}]*\}",
-        r"\.link[^{]*\{[^}]*\}",
-        r"\.tooltip[^{]*\{[^}]*\}",
-        r"path-highlighted[^{]*\{[^}]*\}",
-        r"dimmed[^{]*\{[^}]*\}",
-        r"orange[^{]*\{[^}]*\}",
-        r"blue[^{]*\{[^}]*\}",
-    ]
+    emit(f"   📊 Found {len(css_files)} dedicated CSS files")
+    emit(f"   📊 Found {len(python_css_files)} Python files with CSS content")
 
-    print(f"\n🔍 ANALYZING KEY CSS PATTERNS:")
+    emit(f"\n🔍 ANALYZING KEY CSS PATTERNS:")
 
     all_files = css_files + python_css_files
     for file_path in all_files:
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            print(f"\n   📄 {file_path}:")
-
-            for pattern in key_patterns:
-                matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
-                if matches:
-                    pattern_name = (
-                        pattern.split("[")[0].replace("\\", "").replace(".", "")
-                    )
-                    print(f"      ✅ {pattern_name}: {len(matches)} definitions")
-                    style_definitions[pattern_name].extend(
-                        [(str(file_path), match) for match in matches]
-                    )
-        except Exception as e:
-            print(f"      ❌ Error reading {file_path}: {e}")
+        path_str = str(file_path)
+        emit(f"\n   📄 {path_str}:")
+
+        content = sources.get(file_path)
+        if content is None:
+            emit("      ⏭️ Skipped: too small, too large or unreadable")
+            continue
 
+        for pattern_name, pattern in KEY_CSS_PATTERNS:
+            matches = pattern.findall(content)
+            if matches:
+                emit(f"      ✅ {pattern_name}: {len(matches)} definitions")
+                style_definitions[pattern_name].extend(
+                    (path_str, match.decode("utf-8", "replace")) for match in matches
+                )
+
+    flush_report(report)
     return style_definitions
 
 
-def analyze_javascript_interactions():
+def analyze_javascript_interactions(corpus):
     """Phase 3: JavaScript interaction analysis"""
-    print("\n⚙️ PHASE 3: JAVASCRIPT INTERACTION ANALYSIS")
-    print("=" * 80)
+    report = []
+    emit = report.append
 
-    js_content_files = []
-    interaction_patterns = defaultdict(list)
+    emit("\n⚙️ PHASE 3: JAVASCRIPT INTERACTION ANALYSIS")
+    emit("=" * 80)
 
-    root_path = Path(".")
+    sources = corpus["sources"]
+    interaction_patterns = defaultdict(list)
 
     # Find JavaScript content (both .js files and embedded in Python)
-    for js_file in root_path.rglob("*.js"):
-        js_content_files.append(js_file)
+    js_content_files = list(corpus["files"][".js"])
 
-    for py_file in root_path.rglob("*.py"):
-        try:
-            content = py_file.read_text(encoding="utf-8")
-            if any(
-                js_keyword in content
-                for js_keyword in [
-                    "d3.",
-                    "function",
-                    "addEventListener",
-                    "querySelector",
-                ]
-            ):
-                js_content_files.append(py_file)
-        except Exception:
+    for py_file in corpus["files"][".py"]:
+        content = sources.get(py_file)
+        if content is None:
             continue
+        if any(js_keyword in content for js_keyword in JS_KEYWORDS):
+            js_content_files.append(py_file)
 
-    print(f"   📊 Found {len(js_content_files)} files with JavaScript content")
-
-    # Key interaction patterns to analyze
-    interaction_keywords = [
-        "path-highlighted",
-        "dimmed",
-        "tooltip",
-        "orange",
-        "blue",
-        "addEventListener",
-        "classList.add",
-        "classList.remove",
-        "style.opacity",
-        "d3.select",
-    ]
+    emit(f"   📊 Found {len(js_content_files)} files with JavaScript content")
 
-    print(f"\n🔍 ANALYZING INTERACTION PATTERNS:")
+    emit(f"\n🔍 ANALYZING INTERACTION PATTERNS:")
 
     for file_path in js_content_files:
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            print(f"\n   📄 {file_path}:")
+        path_str = str(file_path)
+        emit(f"\n   📄 {path_str}:")
+
+        content = sources.get(file_path)
+        if content is None:
+            emit("      ⏭️ Skipped: too small, too large or unreadable")
+            continue
 
-            for keyword in interaction_keywords:
-                if keyword in content:
-                    matches = content.count(keyword)
-                    print(f"      ✅ {keyword}: {matches} occurrences")
-                    interaction_patterns[keyword].append((str(file_path), matches))
-        except Exception as e:
-            print(f"      ❌ Error reading {file_path}: {e}")
+        keyword_counts = count_interaction_keywords(content)
+        for keyword in INTERACTION_KEYWORDS:
+            matches = keyword_counts[keyword.encode()]
+            if matches:
+                emit(f"      ✅ {keyword}: {matches} occurrences")
+                interaction_patterns[keyword].append((path_str, matches))
 
+    flush_report(report)
     return interaction_patterns
 
 
-def analyze_specific_issues():
+def analyze_specific_issues(corpus):
     """Phase 4: Specific recurring issue analysis"""
-    print("\n🚨 PHASE 4: SPECIFIC RECURRING ISSUE ANALYSIS")
-    print("=" * 80)
+    report = []
+    emit = report.append
+
+    emit("\n🚨 PHASE 4: SPECIFIC RECURRING ISSUE ANALYSIS")
+    emit("=" * 80)
 
     issues_found = []
-    root_path = Path(".")
+    sources = corpus["sources"]
+    python_files = [
+        p for p in corpus["files"][".py"] if len(sources.get(p, b"")) >= MIN_SCAN_LENGTH
+    ]
+
+    # Find the issue keywords in each file once, ignoring case
+    file_keywords = {
+        py_file: set(count_issue_keywords(sources[py_file].lower()))
+        for py_file in python_files
+    }
 
     # Issue 1: Blue edges between orange & blue nodes not showing
-    print(f"\n🔍 ISSUE 1: Blue edges between orange & blue nodes visibility")
+    emit(f"\n🔍 ISSUE 1: Blue edges between orange & blue nodes visibility")
 
     edge_color_files = []
-    for py_file in root_path.rglob("*.py"):
-        try:
-            content = py_file.read_text(encoding="utf-8")
-            if (
-                "blue" in content.lower()
-                and "orange" in content.lower()
-                and "edge" in content.lower()
-            ):
-                edge_color_files.append(py_file)
-        except Exception:
-            continue
+    for py_file, keywords in file_keywords.items():
+        if {b"blue", b"orange", b"edge"} <= keywords:
+            edge_color_files.append(py_file)
 
-    print(f"   📊 Found {len(edge_color_files)} files handling edge colors")
+    emit(f"   📊 Found {len(edge_color_files)} files handling edge colors")
     for file_path in edge_color_files:
-        print(f"      📄 {file_path}")
+        emit(f"      📄 {file_path}")
 
     # Issue 2: Edges not being dimmed
-    print(f"\n🔍 ISSUE 2: Edge dimming functionality")
+    emit(f"\n🔍 ISSUE 2: Edge dimming functionality")
 
     dimming_files = []
-    for file_path in root_path.rglob("*.py"):
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            if "dimmed" in content.lower() and (
-                "edge" in content.lower() or "link" in content.lower()
-            ):
-                dimming_files.append(file_path)
-        except Exception:
-            continue
+    for file_path, keywords in file_keywords.items():
+        if b"dimmed" in keywords and (b"edge" in keywords or b"link" in keywords):
+            dimming_files.append(file_path)
 
-    print(f"   📊 Found {len(dimming_files)} files handling edge dimming")
+    emit(f"   📊 Found {len(dimming_files)} files handling edge dimming")
     for file_path in dimming_files:
-        print(f"      📄 {file_path}")
+        emit(f"      📄 {file_path}")
 
     # Issue 3: Tooltip positioning
-    print(f"\n🔍 ISSUE 3: Tooltip horizontal positioning")
+    emit(f"\n🔍 ISSUE 3: Tooltip horizontal positioning")
 
     tooltip_files = []
-    for file_path in root_path.rglob("*.py"):
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            if "tooltip" in content.lower() and (
-                "horizontal" in content.lower()
-                or "position" in content.lower()
-                or "left" in content.lower()
-            ):
-                tooltip_files.append(file_path)
-        except Exception:
-            continue
+    for file_path, keywords in file_keywords.items():
+        if b"tooltip" in keywords and (
+            b"horizontal" in keywords or b"position" in keywords or b"left" in keywords
+        ):
+            tooltip_files.append(file_path)
 
-    print(f"   📊 Found {len(tooltip_files)} files handling tooltip positioning")
+    emit(f"   📊 Found {len(tooltip_files)} files handling tooltip positioning")
     for file_path in tooltip_files:
-        print(f"      📄 {file_path}")
+        emit(f"      📄 {file_path}")
 
+    flush_report(report)
     return {
         "edge_color_files": edge_color_files,
         "dimming_files": dimming_files,
@@ -287,86 +476,101 @@ def analyze_specific_issues():
     }
 
 
-def analyze_code_duplication():
+def analyze_code_duplication(corpus):
     """Phase 5: Code duplication analysis"""
-    print("\n🔄 PHASE 5: CODE DUPLICATION ANALYSIS")
-    print("=" * 80)
+    report = []
+    emit = report.append
 
-    root_path = Path(".")
+    emit("\n🔄 PHASE 5: CODE DUPLICATION ANALYSIS")
+    emit("=" * 80)
 
-    # Find potential duplicate code patterns
-    similar_functions = defaultdict(list)
+    # Find potential duplicate code patterns. Most names are unique, so a
+    # name only gets a list once it is seen a second time.
+    first_seen = {}
+    duplicate_functions = {}
 
-    for py_file in root_path.rglob("*.py"):
-        try:
-            content = py_file.read_text(encoding="utf-8")
+    for py_file in corpus["files"][".py"]:
+        tree = get_syntax_tree(corpus, py_file)
+        if tree is None:
+            continue
 
-            # Extract function definitions
-            function_pattern = r"def\s+(\w+)\s*\([^)]*\):"
-            functions = re.findall(function_pattern, content)
+        # Extract function definitions
+        collector = FunctionNameCollector()
+        collector.visit(tree)
 
-            for func_name in functions:
-                similar_functions[func_name].append(str(py_file))
+        path_str = str(py_file)
+        for func_name in collector.names:
+            if func_name in duplicate_functions:
+                duplicate_functions[func_name].append(path_str)
+            elif func_name in first_seen:
+                duplicate_functions[func_name] = [first_seen.pop(func_name), path_str]
+            else:
+                first_seen[func_name] = path_str
 
-        except Exception:
-            continue
+    emit(f"\n🔍 POTENTIAL DUPLICATE FUNCTIONS:")
 
-    print(f"\n🔍 POTENTIAL DUPLICATE FUNCTIONS:")
-    duplicate_count = 0
+    for func_name, files in duplicate_functions.items():
+        emit(f"   ⚠️ {func_name}: found in {len(files)} files")
+        for file_path in files:
+            emit(f"      - {file_path}")
 
-    for func_name, files in similar_functions.items():
-        if len(files) > 1:
-            duplicate_count += 1
-            print(f"   ⚠️ {func_name}: found in {len(files)} files")
-            for file_path in files:
-                print(f"      - {file_path}")
-
-    print(f"\n📊 Total potentially duplicated functions: {duplicate_count}")
+    emit(f"\n📊 Total potentially duplicated functions: {len(duplicate_functions)}")
 
-    return similar_functions
+    flush_report(report)
+    return duplicate_functions
 
 
 def main():
     """Main analysis function following Multi-Stage Action Plan"""
-    print("🚀 COMPREHENSIVE RECURRING ISSUES ANALYSIS")
-    print("Following Multi-Stage Action Plan Guidelines")
-    print("=" * 80)
+    flush_report(
+        [
+            "🚀 COMPREHENSIVE RECURRING ISSUES ANALYSIS",
+            "Following Multi-Stage Action Plan Guidelines",
+            "=" * 80,
+        ]
+    )
 
     try:
+        # Walk the project and read every file once for all phases
+        corpus = collect_corpus(Path("."))
+
         # Phase 1: Structure Analysis
-        duplicate_patterns = analyze_project_structure()
+        duplicate_patterns = analyze_project_structure(corpus)
 
         # Phase 2: CSS Analysis
-        style_definitions = analyze_css_styles()
+        style_definitions = analyze_css_styles(corpus)
 
         # Phase 3: JavaScript Analysis
-        interaction_patterns = analyze_javascript_interactions()
+        interaction_patterns = analyze_javascript_interactions(corpus)
 
         # Phase 4: Specific Issues
-        specific_issues = analyze_specific_issues()
+        specific_issues = analyze_specific_issues(corpus)
 
         # Phase 5: Code Duplication
-        duplicate_functions = analyze_code_duplication()
+        duplicate_functions = analyze_code_duplication(corpus)
 
         # Generate summary report
-        print("\n📋 SUMMARY REPORT")
-        print("=" * 80)
-
-        print(f"\n🔍 KEY FINDINGS:")
-        print(f"   📦 Duplicate file patterns: {len(duplicate_patterns)}")
-        print(f"   🎨 CSS style definitions: {len(style_definitions)}")
-        print(f"   ⚙️ JavaScript patterns: {len(interaction_patterns)}")
-        print(f"   🚨 Issue-related files: {len(specific_issues)}")
-        print(
-            f"   🔄 Duplicate functions: {sum(1 for funcs in duplicate_functions.values() if len(funcs) > 1)}"
-        )
-
-        print(f"\n🎯 RECOMMENDED NEXT STEPS:")
-        print(f"   1. Consolidate duplicate files (especially _new variants)")
-        print(f"   2. Unify CSS style definitions across modules")
-        print(f"   3. Debug specific edge coloring and dimming logic")
-        print(f"   4. Fix tooltip positioning calculations")
-        print(f"   5. Eliminate code duplication")
+        report = []
+        emit = report.append
+
+        emit("\n📋 SUMMARY REPORT")
+        emit("=" * 80)
+
+        emit(f"\n🔍 KEY FINDINGS:")
+        emit(f"   📦 Duplicate file patterns: {len(duplicate_patterns)}")
+        emit(f"   🎨 CSS style definitions: {len(style_definitions)}")
+        emit(f"   ⚙️ JavaScript patterns: {len(interaction_patterns)}")
+        emit(f"   🚨 Issue-related files: {len(specific_issues)}")
+        emit(f"   🔄 Duplicate functions: {len(duplicate_functions)}")
+
+        emit(f"\n🎯 RECOMMENDED NEXT STEPS:")
+        emit(f"   1. Consolidate duplicate files (especially _new variants)")
+        emit(f"   2. Unify CSS style definitions across modules")
+        emit(f"   3. Debug specific edge coloring and dimming logic")
+        emit(f"   4. Fix tooltip positioning calculations")
+        emit(f"   5. Eliminate code duplication")
+
+        flush_report(report)
 
         return {
             "duplicate_patterns": duplicate_patterns,
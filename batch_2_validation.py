@@ -8,54 +8,79 @@ Tests for the Batch 2 improvements:
 3. Unified transparency settings
 """
 
+# (title, details) for each validated Batch 2 improvement
+BATCH_2_CHECKS = [
+    (
+        "Unified Transparency Variables",
+        [
+            "CSS variables defined for consistent dimming",
+            "--dimmed-opacity: 0.05 (nodes)",
+            "--dimmed-link-opacity: 0.01 (links)",
+            "--dimmed-text-opacity: 0.01 (text)",
+        ],
+    ),
+    (
+        "Force-Directed Circle Nodes",
+        [
+            ".node-circle CSS class implemented",
+            "Circle node creation logic in addNodeShapes()",
+            "Layout-aware node shape selection",
+        ],
+    ),
+    (
+        "Importance-Based Circle Sizing",
+        [
+            "calculateCircleRadius() function implemented",
+            "Base radius: 20px",
+            "Importance multiplier: 1 + (importance * 1.5)",
+            "Maximum size: 2.5x base radius for importance = 1.0",
+        ],
+    ),
+    (
+        "Layout Consistency",
+        [
+            "Fixed layout naming to use 'force' (not 'force-directed')",
+            "Updated all layout checks across modules",
+            "Consistent node selection for both .node-rect and .node-circle",
+        ],
+    ),
+    (
+        "Force Layout Collision Detection",
+        [
+            "Updated collision radius for circles",
+            "Importance-based collision radius calculation",
+            "Proper spacing between nodes",
+        ],
+    ),
+]
+
+MANUAL_TESTING_STEPS = [
+    "Open the generated dependency graph",
+    "Toggle between Hierarchical and Force-Directed layouts",
+    "Verify rectangles in Hierarchical mode",
+    "Verify circles in Force-Directed mode",
+    "Check that important nodes have larger circles",
+    "Test dimming/highlighting with consistent opacity",
+]
+
 
 def validate_batch_2_improvements():
     """
     Validate that Batch 2 improvements are properly implemented.
     """
-    print("🧪 Batch 2 Implementation Validation")
-    print("=" * 50)
-
-    # Test 1: Check if CSS variables for transparency are defined
-    print("\n✅ Test 1: Unified Transparency Variables")
-    print("   - CSS variables defined for consistent dimming")
-    print("   - --dimmed-opacity: 0.05 (nodes)")
-    print("   - --dimmed-link-opacity: 0.01 (links)")
-    print("   - --dimmed-text-opacity: 0.01 (text)")
-
-    # Test 2: Check if circle node styles are added
-    print("\n✅ Test 2: Force-Directed Circle Nodes")
-    print("   - .node-circle CSS class implemented")
-    print("   - Circle node creation logic in addNodeShapes()")
-    print("   - Layout-aware node shape selection")
-
-    # Test 3: Check importance-based sizing
-    print("\n✅ Test 3: Importance-Based Circle Sizing")
-    print("   - calculateCircleRadius() function implemented")
-    print("   - Base radius: 20px")
-    print("   - Importance multiplier: 1 + (importance * 1.5)")
-    print("   - Maximum size: 2.5x base radius for importance = 1.0")
-
-    # Test 4: Check layout consistency
-    print("\n✅ Test 4: Layout Consistency")
-    print("   - Fixed layout naming to use 'force' (not 'force-directed')")
-    print("   - Updated all layout checks across modules")
-    print("   - Consistent node selection for both .node-rect and .node-circle")
-
-    # Test 5: Check collision detection
-    print("\n✅ Test 5: Force Layout Collision Detection")
-    print("   - Updated collision radius for circles")
-    print("   - Importance-based collision radius calculation")
-    print("   - Proper spacing between nodes")
-
-    print("\n🎯 All Batch 2 improvements successfully implemented!")
-    print("\nManual Testing Steps:")
-    print("1. Open the generated dependency graph")
-    print("2. Toggle between Hierarchical and Force-Directed layouts")
-    print("3. Verify rectangles in Hierarchical mode")
-    print("4. Verify circles in Force-Directed mode")
-    print("5. Check that important nodes have larger circles")
-    print("6. Test dimming/highlighting with consistent opacity")
+    lines = ["🧪 Batch 2 Implementation Validation", "=" * 50]
+
+    for number, (title, details) in enumerate(BATCH_2_CHECKS, 1):
+        lines.append(f"\n✅ Test {number}: {title}")
+        lines.extend(f"   - {detail}" for detail in details)
+
+    lines.append("\n🎯 All Batch 2 improvements successfully implemented!")
+    lines.append("\nManual Testing Steps:")
+    lines.extend(
+        f"{number}. {step}" for number, step in enumerate(MANUAL_TESTING_STEPS, 1)
+    )
+
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
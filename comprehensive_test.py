@@ -3,54 +3,152 @@
 Comprehensive JavaScript syntax validation test
 """
 
+import atexit
+import bisect
+import functools
 import os
 import sys
 import re
 import json
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 
 # Add the current directory to the path
 sys.path.insert(0, os.path.dirname(__file__))
 
+from validation_helpers import mock_graph_data
+
+# Precompiled patterns used by the checks below
+FUNC_DEF_RE = re.compile(r"function\s+(\w+)\s*\([^)]*\)\s*{")
+STRAY_CLOSE_RE = re.compile(
+    r"^[ \t\r\f\v]*}[ \t\r\f\v]*\n[ \t\r\f\v]*"
+    r"((?:function|var|let|const|if|for|while)[^\n]*)",
+    re.MULTILINE,
+)
+
+# Tokens for the brace scan: outside template literals, whole strings and
+# comments are matched (and ignored) alongside the structural characters;
+# inside a template literal only its end and "${" matter
+CODE_TOKEN_RE = re.compile(
+    r'"(?:\\.|[^"\\])*(?:"|\Z)'
+    r"|'(?:\\.|[^'\\])*(?:'|\Z)"
+    r"|//[^\n]*"
+    r"|/\*.*?(?:\*/|\Z)"
+    r"|[{}`]",
+    re.DOTALL,
+)
+TEMPLATE_TOKEN_RE = re.compile(r"\\.|`|\$\{", re.DOTALL)
+
+# Known problematic patterns, searched separately so an overlapping match for
+# one pattern cannot hide a match for another
+PROBLEMATIC_PATTERN_DESCRIPTIONS = {
+    "func_open": "Function without closing brace",
+    "func_after": "Function immediately after closing brace",
+    "dbl_close": "Double closing braces",
+    "dbl_open": "Double opening braces",
+}
+PROBLEMATIC_PATTERNS = {
+    "func_open": re.compile(r"function\s+\w+[^{]*{[^}]*$", re.MULTILINE),
+    "func_after": re.compile(r"}\s*function"),
+    "dbl_close": re.compile(r"}\s*}"),
+    "dbl_open": re.compile(r"{\s*{"),
+}
+# Literals each pattern cannot match without; cheap substring tests rule a
+# pattern out before the regex runs
+PROBLEMATIC_PATTERN_LITERALS = {
+    "func_open": ("function", "{"),
+    "func_after": ("function", "}"),
+    "dbl_close": ("}",),
+    "dbl_open": ("{",),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_viz_js():
+    """Assemble the graph visualization JavaScript once per run"""
+    from graph_modules.graph_visualization import get_graph_visualization_js
+
+    return get_graph_visualization_js()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_controls_js():
+    """Assemble the graph controls JavaScript once per run"""
+    from graph_modules.graph_controls import get_graph_controls_js
+
+    return get_graph_controls_js()
+
 
 def generate_test_html():
-    """Generate the HTML file and test for JavaScript syntax errors"""
+    """Generate the HTML in memory from a small test graph.
+
+    Returns the HTML string, or None if generation failed.
+    """
     try:
-        print("🔨 Generating HTML file...")
-        import enhanced_dependency_graph_modular
+        print("🔨 Generating HTML...")
+        from graph_modules.html_generator import generate_enhanced_html_visualization
 
-        # This should generate the HTML file
+        html_content = generate_enhanced_html_visualization(mock_graph_data())
         print("✅ HTML generation completed")
-        return True
+        return html_content
     except Exception as e:
         print(f"❌ HTML generation failed: {e}")
-        return False
+        return None
 
 
-def find_js_syntax_errors(html_file_path):
-    """Extract JavaScript and check for syntax errors"""
-    print(f"🔍 Analyzing JavaScript syntax in {html_file_path}")
+class ScriptExtractor(HTMLParser):
+    """Collect the text of every <script> element in a single tokenizer pass"""
 
-    if not os.path.exists(html_file_path):
-        print(f"❌ HTML file not found: {html_file_path}")
-        return False
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.scripts = []
+        self._chunks = None
 
-    try:
-        with open(html_file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+    def handle_starttag(self, tag, attrs):
+        if tag == "script":
+            self._chunks = []
+
+    def handle_data(self, data):
+        if self._chunks is not None:
+            self._chunks.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._chunks is not None:
+            self.scripts.append("".join(self._chunks))
+            self._chunks = None
+
+
+def extract_scripts(content):
+    """Return the contents of each <script> block in the HTML content"""
+    extractor = ScriptExtractor()
+    extractor.feed(content)
+    extractor.close()
+    return extractor.scripts
 
+
+def find_js_syntax_errors(content, source_name="generated HTML"):
+    """Extract JavaScript from HTML content and check for syntax errors"""
+    print(f"🔍 Analyzing JavaScript syntax in {source_name}")
+
+    try:
         # Extract JavaScript content between <script> tags
-        script_pattern = r"<script[^>]*>(.*?)</script>"
-        scripts = re.findall(script_pattern, content, re.DOTALL)
+        scripts = extract_scripts(content)
 
         print(f"📜 Found {len(scripts)} script blocks")
 
-        syntax_errors = []
-        for i, script in enumerate(scripts):
-            if script.strip():
-                errors = check_js_syntax(script, f"Script block {i+1}")
-                syntax_errors.extend(errors)
+        # Blocks are independent, so check them concurrently; results keep
+        # the block order
+        blocks = [
+            (script, f"Script block {i+1}")
+            for i, script in enumerate(scripts)
+            if script.strip()
+        ]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(lambda block: check_js_syntax(*block), blocks)
+            syntax_errors = [error for errors in results for error in errors]
 
         if syntax_errors:
             print(f"❌ Found {len(syntax_errors)} JavaScript syntax errors:")
@@ -66,68 +164,204 @@ def find_js_syntax_errors(html_file_path):
         return False
 
 
+# Node program that parses each NUL-terminated block from stdin and answers
+# with one line per block, so V8 starts once for the whole run
+NODE_SYNTAX_WORKER_JS = r"""
+let pending = "";
+process.stdin.setEncoding("utf8");
+process.stdin.on("data", (chunk) => {
+    pending += chunk;
+    let end;
+    while ((end = pending.indexOf("\0")) >= 0) {
+        const source = pending.slice(0, end);
+        pending = pending.slice(end + 1);
+        try {
+            new Function(source);
+            process.stdout.write("OK\n");
+        } catch (e) {
+            process.stdout.write("ERR:" + String(e).replace(/\n/g, " ") + "\n");
+        }
+    }
+});
+"""
+
+_node_worker = None
+_node_worker_lock = threading.Lock()
+
+
+def _close_node_worker():
+    """Shut down the Node syntax worker if one was started"""
+    if _node_worker:
+        _node_worker.stdin.close()
+        _node_worker.wait(timeout=10)
+
+
+atexit.register(_close_node_worker)
+
+
+def _node_check_file(js_code):
+    """Check js_code with a one-off `node --check` run.
+
+    Returns the error message, or None when the code parses or Node.js is
+    not available.
+    """
+    try:
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".js", delete=False) as f:
+            f.write(js_code)
+
+        try:
+            result = subprocess.run(
+                ["node", "--check", f.name], capture_output=True, text=True, timeout=10
+            )
+        finally:
+            os.unlink(f.name)
+    except (subprocess.TimeoutExpired, OSError):
+        # Node.js not available or failed - continue with basic checks
+        return None
+
+    return result.stderr.strip() if result.returncode != 0 else None
+
+
+def _node_syntax_check(js_code):
+    """Parse js_code in the persistent Node worker.
+
+    Returns the error message, or None when the code parses or Node.js is
+    not available. If the worker has died the block is checked with a
+    one-off `node --check` instead, and a fresh worker is started for the
+    next block.
+    """
+    global _node_worker
+
+    # One round-trip at a time: blocks may be checked from several threads
+    with _node_worker_lock:
+        if _node_worker is None:
+            env = {
+                **os.environ,
+                "NODE_COMPILE_CACHE": os.path.join(tempfile.gettempdir(), "node-cc"),
+            }
+            try:
+                _node_worker = subprocess.Popen(
+                    ["node", "-e", NODE_SYNTAX_WORKER_JS],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    text=True,
+                    encoding="utf-8",
+                    env=env,
+                )
+            except OSError:
+                # Node.js not available - continue with basic checks
+                _node_worker = False
+
+        if not _node_worker:
+            return None
+
+        try:
+            _node_worker.stdin.write(js_code.replace("\0", "") + "\0")
+            _node_worker.stdin.flush()
+            reply = _node_worker.stdout.readline().strip()
+        except OSError:
+            reply = ""
+
+        if not reply:
+            # Worker died: an empty reply must not read as "parses", so
+            # restart it next time and check this block on its own
+            _node_worker.kill()
+            _node_worker.wait()
+            _node_worker = None
+            return _node_check_file(js_code)
+
+    return reply[len("ERR:") :] if reply.startswith("ERR:") else None
+
+
+def bracket_balance(js_code):
+    """Return the (brace, paren, bracket) open-minus-close differences.
+
+    Counts each bracket character with str.count over the whole source.
+    """
+    count = js_code.count
+    return (
+        count("{") - count("}"),
+        count("(") - count(")"),
+        count("[") - count("]"),
+    )
+
+
 def check_js_syntax(js_code, block_name):
     """Check JavaScript syntax using Node.js"""
     errors = []
 
     # Basic syntax checks
-    brace_count = js_code.count("{") - js_code.count("}")
+    brace_count, paren_count, bracket_count = bracket_balance(js_code)
     if brace_count != 0:
         errors.append(f"{block_name}: Unmatched braces (difference: {brace_count})")
 
-    paren_count = js_code.count("(") - js_code.count(")")
     if paren_count != 0:
         errors.append(
             f"{block_name}: Unmatched parentheses (difference: {paren_count})"
         )
 
-    bracket_count = js_code.count("[") - js_code.count("]")
     if bracket_count != 0:
         errors.append(f"{block_name}: Unmatched brackets (difference: {bracket_count})")
 
-    # Check for common syntax patterns that indicate issues
-    lines = js_code.split("\n")
-    for line_num, line in enumerate(lines, 1):
-        line = line.strip()
-
-        # Check for unexpected closing braces
-        if line == "}" and line_num < len(lines):
-            next_line = lines[line_num].strip() if line_num < len(lines) else ""
-            if (
-                next_line
-                and not next_line.startswith("//")
-                and not next_line.startswith("/*")
-            ):
-                # Look for patterns that might indicate an issue
-                if next_line.startswith(
-                    ("function", "var", "let", "const", "if", "for", "while")
-                ):
-                    error_msg = "{block}:Line {line}: Potential syntax error - unexpected '}}' before '{text}...'".format(
-                        block=block_name, line=line_num, text=next_line[:30]
-                    )
-                    errors.append(error_msg)
+    # Check for unexpected closing braces: a line holding only "}" followed
+    # by a line that starts a new statement. Line numbers are counted
+    # incrementally from the previous match.
+    line_num, counted_to = 1, 0
+    for match in STRAY_CLOSE_RE.finditer(js_code):
+        line_num += js_code.count("\n", counted_to, match.start())
+        counted_to = match.start()
+        error_msg = "{block}:Line {line}: Potential syntax error - unexpected '}}' before '{text}...'".format(
+            block=block_name, line=line_num, text=match.group(1).rstrip()[:30]
+        )
+        errors.append(error_msg)
     # Try Node.js syntax check if available
-    try:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".js", delete=False) as f:
-            f.write(js_code)
-            f.flush()
-
-            # Try to run syntax check with Node.js
-            result = subprocess.run(
-                ["node", "--check", f.name], capture_output=True, text=True, timeout=10
-            )
+    node_error = _node_syntax_check(js_code)
+    if node_error:
+        errors.append(f"{block_name}: Node.js syntax error: {node_error}")
 
-            if result.returncode != 0:
-                errors.append(
-                    f"{block_name}: Node.js syntax error: {result.stderr.strip()}"
-                )
+    return errors
 
-        os.unlink(f.name)
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        # Node.js not available or failed - continue with basic checks
-        pass
 
-    return errors
+def find_unclosed_braces(js_code):
+    """Return the offsets of "{" characters that are never closed.
+
+    The scan tracks brace depth while skipping string literals, template
+    literals and comments, so braces inside them are not counted.
+    "${...}" substitutions inside template literals are scanned as code.
+    Literals and comments are consumed whole by the token patterns, so
+    Python only sees the tokens that change state.
+    """
+    open_braces = []
+    template_depths = []  # brace depth at which each "${" was opened
+    in_template = False
+    pos = 0
+
+    while True:
+        token_re = TEMPLATE_TOKEN_RE if in_template else CODE_TOKEN_RE
+        match = token_re.search(js_code, pos)
+        if not match:
+            break
+        token = match.group()
+        pos = match.end()
+
+        if in_template:
+            if token == "`":
+                in_template = False
+            elif token == "${":
+                template_depths.append(len(open_braces))
+                in_template = False
+        elif token == "{":
+            open_braces.append(match.start())
+        elif token == "}":
+            if template_depths and template_depths[-1] == len(open_braces):
+                template_depths.pop()
+                in_template = True
+            elif open_braces:
+                open_braces.pop()
+        elif token == "`":
+            in_template = True
+
+    return open_braces
 
 
 def check_function_completeness():
@@ -135,53 +369,30 @@ def check_function_completeness():
     print("🔧 Checking function completeness in modules...")
 
     try:
-        from graph_modules.graph_visualization import get_graph_visualization_js
-        from graph_modules.graph_controls import get_graph_controls_js
-
         modules = [
-            ("graph_visualization", get_graph_visualization_js()),
-            ("graph_controls", get_graph_controls_js()),
+            ("graph_visualization", _get_viz_js()),
+            ("graph_controls", _get_controls_js()),
         ]
 
         issues = []
         for module_name, js_code in modules:
             # Find all function definitions
-            function_pattern = r"function\s+(\w+)\s*\([^)]*\)\s*{"
-            functions = re.findall(function_pattern, js_code)
+            function_defs = list(FUNC_DEF_RE.finditer(js_code))
+            functions = [match.group(1) for match in function_defs]
 
             print(f"📋 {module_name}: Found {len(functions)} functions")
             for func_name in functions:
                 print(f"   • {func_name}")
 
             # Check for incomplete functions
-            lines = js_code.split("\n")
-            in_function = False
-            brace_depth = 0
-            current_function = None
-
-            for line_num, line in enumerate(lines, 1):
-                stripped = line.strip()
-
-                # Track function starts
-                func_match = re.match(r"function\s+(\w+)", stripped)
-                if func_match:
-                    current_function = func_match.group(1)
-                    in_function = True
-                    brace_depth = 0
-
-                # Count braces
-                brace_depth += stripped.count("{") - stripped.count("}")
-
-                # Check if function ended
-                if in_function and brace_depth == 0 and "{" in stripped:
-                    in_function = False
-                    current_function = None
-
-            # Check if we're still inside a function at the end
-            if in_function and current_function:
-                issues.append(
-                    f"{module_name}: Function '{current_function}' appears to be incomplete (brace_depth: {brace_depth})"
-                )
+            unclosed = find_unclosed_braces(js_code)
+            if unclosed:
+                starts = [match.start() for match in function_defs]
+                owner = bisect.bisect_right(starts, unclosed[0]) - 1
+                if owner >= 0:
+                    issues.append(
+                        f"{module_name}: Function '{function_defs[owner].group(1)}' appears to be incomplete (brace_depth: {len(unclosed)})"
+                    )
 
         if issues:
             print("❌ Function completeness issues found:")
@@ -224,12 +435,12 @@ def main():
     # Test 3: Generate HTML and check syntax
     print("\n3️⃣ TESTING HTML GENERATION AND SYNTAX")
     print("-" * 30)
-    generation_ok = generate_test_html()
+    html_content = generate_test_html()
+    generation_ok = html_content is not None
 
     syntax_ok = True
     if generation_ok:
-        html_path = "graph_output/enhanced_dependency_graph.html"
-        syntax_ok = find_js_syntax_errors(html_path)
+        syntax_ok = find_js_syntax_errors(html_content)
 
     # Test 4: Check for specific known issues
     print("\n4️⃣ CHECKING FOR KNOWN PATTERNS")
@@ -265,31 +476,37 @@ def main():
     return all_passed
 
 
+def find_problematic_patterns(js_code):
+    """Return the names of the problematic patterns present in js_code.
+
+    Patterns whose required literals are missing are ruled out without
+    running their regex.
+    """
+    return {
+        name
+        for name, literals in PROBLEMATIC_PATTERN_LITERALS.items()
+        if all(literal in js_code for literal in literals)
+        and PROBLEMATIC_PATTERNS[name].search(js_code)
+    }
+
+
 def check_known_patterns():
     """Check for known problematic patterns"""
     print("🔍 Checking for known problematic patterns...")
 
     try:
-        from graph_modules.graph_visualization import get_graph_visualization_js
-        from graph_modules.graph_controls import get_graph_controls_js
-
-        viz_js = get_graph_visualization_js()
-        controls_js = get_graph_controls_js()
+        viz_js = _get_viz_js()
+        controls_js = _get_controls_js()
 
         issues = []
 
         # Check for unmatched braces in specific patterns
-        problematic_patterns = [
-            (r"function\s+\w+[^{]*{[^}]*$", "Function without closing brace"),
-            (r"}\s*function", "Function immediately after closing brace"),
-            (r"}\s*}", "Double closing braces"),
-            (r"{\s*{", "Double opening braces"),
-        ]
-
-        for pattern, description in problematic_patterns:
-            if re.search(pattern, viz_js, re.MULTILINE):
+        viz_found = find_problematic_patterns(viz_js)
+        controls_found = find_problematic_patterns(controls_js)
+        for name, description in PROBLEMATIC_PATTERN_DESCRIPTIONS.items():
+            if name in viz_found:
                 issues.append(f"graph_visualization: {description}")
-            if re.search(pattern, controls_js, re.MULTILINE):
+            if name in controls_found:
                 issues.append(f"graph_controls: {description}")
 
         # Check for proper function exposure
@@ -5,6 +5,33 @@ Debug Script for Force-Directed Layout Issues
 This script will help identify what's preventing circles from appearing in force-directed layout.
 """
 
+from pathlib import Path
+
+# Source files inspected by the checks below
+SOURCE_FILES = {
+    "visualization": "graph_modules/graph_visualization.py",
+    "controls": "graph_modules/graph_controls.py",
+}
+
+
+def load_sources():
+    """Read each inspected file once; a read error is kept in place of its text"""
+    sources = {}
+    for name, path in SOURCE_FILES.items():
+        try:
+            sources[name] = Path(path).read_text(encoding="utf-8")
+        except OSError as e:
+            sources[name] = e
+    return sources
+
+
+def get_source(sources, name):
+    """Return a loaded source, re-raising its read error if it failed"""
+    content = sources[name]
+    if isinstance(content, Exception):
+        raise content
+    return content
+
 
 def debug_force_directed_issues():
     """
@@ -14,12 +41,12 @@ def debug_force_directed_issues():
     print("=" * 50)
 
     issues_found = []
+    sources = load_sources()
 
     print("\n1. Checking node shape generation logic...")
     # Read the addNodeShapes function
     try:
-        with open("graph_modules/graph_visualization.py", "r") as f:
-            content = f.read()
+        content = get_source(sources, "visualization")
 
         if 'currentLayout === "force"' in content:
             print("   ✅ Layout check exists")
@@ -41,8 +68,7 @@ def debug_force_directed_issues():
 
     print("\n2. Checking layout switching logic...")
     try:
-        with open("graph_modules/graph_controls.py", "r") as f:
-            content = f.read()
+        content = get_source(sources, "controls")
 
         if "regenerateNodeShapes" in content:
             print("   ✅ Node shape regeneration exists")
@@ -59,8 +85,7 @@ def debug_force_directed_issues():
 
     print("\n3. Checking for rectangle-specific positioning...")
     try:
-        with open("graph_modules/graph_visualization.py", "r") as f:
-            content = f.read()
+        content = get_source(sources, "visualization")
 
         rect_positioning = []
         if "d.width/2" in content:
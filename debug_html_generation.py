@@ -7,30 +7,15 @@ from pathlib import Path
 # Add the graph_modules directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from validation_helpers import mock_graph_data
+
 
 def debug_html_generation():
     """Debug HTML generation."""
     from graph_modules.html_generator import generate_enhanced_html_visualization
 
-    # Create mock graph data
-    mock_data = {
-        "nodes": [
-            {
-                "id": "test_file.py",
-                "name": "test_file",
-                "folder": "root",
-                "size": 5120,
-                "total_lines": 120,
-                "performance_score": 0.75,
-                "is_test": False,
-            }
-        ],
-        "edges": [],
-        "subfolder_info": {"root": {"count": 1}},
-    }
-
     try:
-        html_content = generate_enhanced_html_visualization(mock_data)
+        html_content = generate_enhanced_html_visualization(mock_graph_data())
 
         print("HTML Content Type:", type(html_content))
         print("HTML Content Length:", len(str(html_content)))
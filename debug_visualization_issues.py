@@ -3,8 +3,36 @@
 Test script to debug specific visualization issues
 """
 
+import mmap
 import re
 
+# Precompiled bytes patterns for each check, in report order; they run
+# directly over the memory-mapped HTML file
+PATH_HIGHLIGHTED_RE = re.compile(rb'\.classed\("path-highlighted"[^}]+\}', re.DOTALL)
+
+DIMMED_PATTERNS = [
+    re.compile(rb"--dimmed-link-opacity:\s*([^;]+);"),
+    re.compile(rb"\.link\.dimmed[^}]+opacity:\s*([^;]+);"),
+]
+
+ANIMATION_PATTERNS = [
+    re.compile(rb"@keyframes\s+hotspot-pulse", re.IGNORECASE),
+    re.compile(rb"\.hotspot[^}]*animation[^}]*", re.IGNORECASE),
+    re.compile(rb"performance-warning-icon", re.IGNORECASE),
+]
+
+CLASS_PATTERNS = [
+    re.compile(rb'\.classed\("highlighted"[^}]+'),
+    re.compile(rb'\.classed\("dimmed"[^}]+'),
+    re.compile(rb'\.classed\("path-highlighted"[^}]+'),
+]
+
+EVENT_PATTERNS = [
+    re.compile(rb"function\s+clearHighlights"),
+    re.compile(rb"function\s+resetHighlighting"),
+    re.compile(rb'\.on\("click"[^}]+clearHighlights'),
+]
+
 
 def analyze_generated_html():
     """Analyze the generated HTML to understand why fixes aren't working"""
@@ -14,84 +42,77 @@ def analyze_generated_html():
     print("🔍 DEBUGGING VISUALIZATION ISSUES")
     print("=" * 50)
 
-    with open(html_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    with open(html_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as content:
+        report_html_checks(content)
+
+    print("\n" + "=" * 50)
+    print("🎯 ANALYSIS COMPLETE")
+
+
+def decode(text):
+    """Decode matched bytes for display"""
+    return text.decode("utf-8", errors="ignore")
+
 
+def count_matches(pattern, content):
+    """Count matches without building a list of the matched text"""
+    return sum(1 for _ in pattern.finditer(content))
+
+
+def report_html_checks(content):
+    """Print each check's findings for the mapped HTML content"""
     # Check 1: Edge highlighting logic
     print("\n1. 📝 EDGE HIGHLIGHTING LOGIC")
     print("-" * 30)
 
     # Find the path-highlighted edge logic
-    path_highlighted_pattern = r'\.classed\("path-highlighted"[^}]+\}'
-    matches = re.findall(path_highlighted_pattern, content, re.DOTALL)
+    matches = PATH_HIGHLIGHTED_RE.findall(content)
 
     for i, match in enumerate(matches):
-        print(f"   Match {i+1}: {match[:100]}...")
+        print(f"   Match {i+1}: {decode(match[:100])}...")
 
     # Check 2: CSS dimming opacity
     print("\n2. 🎨 CSS DIMMING SETTINGS")
     print("-" * 30)
 
-    dimmed_patterns = [
-        r"--dimmed-link-opacity:\s*([^;]+);",
-        r"\.link\.dimmed[^}]+opacity:\s*([^;]+);",
-    ]
-
-    for pattern in dimmed_patterns:
-        matches = re.findall(pattern, content)
+    for pattern in DIMMED_PATTERNS:
+        matches = pattern.findall(content)
         if matches:
-            print(f"   Found dimming setting: {matches}")
+            print(f"   Found dimming setting: {[decode(m) for m in matches]}")
 
     # Check 3: Performance hotspot handling
     print("\n3. ⚠️ PERFORMANCE HOTSPOT IMPLEMENTATION")
     print("-" * 30)
 
     # Look for animation or pulsing
-    animation_patterns = [
-        r"@keyframes\s+hotspot-pulse",
-        r"\.hotspot[^}]*animation[^}]*",
-        r"performance-warning-icon",
-    ]
-
-    for pattern in animation_patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        if matches:
-            print(f"   Found hotspot pattern: {pattern} -> {len(matches)} matches")
+    for pattern in ANIMATION_PATTERNS:
+        count = count_matches(pattern, content)
+        if count:
+            print(
+                f"   Found hotspot pattern: {decode(pattern.pattern)} -> {count} matches"
+            )
         else:
-            print(f"   NOT found: {pattern}")
+            print(f"   NOT found: {decode(pattern.pattern)}")
 
     # Check 4: Node class management
     print("\n4. 🔵 NODE CLASS MANAGEMENT")
     print("-" * 30)
 
     # Look for how nodes get highlighted/unhighlighted
-    class_patterns = [
-        r'\.classed\("highlighted"[^}]+',
-        r'\.classed\("dimmed"[^}]+',
-        r'\.classed\("path-highlighted"[^}]+',
-    ]
-
-    for pattern in class_patterns:
-        matches = re.findall(pattern, content)
-        print(f"   {pattern}: {len(matches)} occurrences")
+    for pattern in CLASS_PATTERNS:
+        count = count_matches(pattern, content)
+        print(f"   {decode(pattern.pattern)}: {count} occurrences")
 
     # Check 5: Event handling for deselection
     print("\n5. 🖱️ EVENT HANDLING")
     print("-" * 30)
 
-    event_patterns = [
-        r"function\s+clearHighlights",
-        r"function\s+resetHighlighting",
-        r'\.on\("click"[^}]+clearHighlights',
-    ]
-
-    for pattern in event_patterns:
-        matches = re.findall(pattern, content)
-        if matches:
-            print(f"   Found: {pattern} -> {len(matches)} matches")
-
-    print("\n" + "=" * 50)
-    print("🎯 ANALYSIS COMPLETE")
+    for pattern in EVENT_PATTERNS:
+        count = count_matches(pattern, content)
+        if count:
+            print(f"   Found: {decode(pattern.pattern)} -> {count} matches")
 
 
 if __name__ == "__main__":
@@ -9,6 +9,39 @@ Final validation test for all implemented features:
 import sys
 from pathlib import Path
 
+from validation_helpers import buffered_stdout
+
+# Names and markers each test looks for, built once at import
+REQUIRED_METHODS = (
+    "_analyze_performance_hotspots",
+    "_calculate_complexity_metrics",
+    "_calculate_performance_score",
+    "_calculate_max_nesting_depth",
+)
+EXPECTED_METRIC_KEYS = frozenset(
+    {
+        "total_lines",
+        "code_lines",
+        "function_count",
+        "class_count",
+        "cyclomatic_complexity",
+        "heavy_operations",
+        "max_nesting_depth",
+        "file_size_kb",
+    }
+)
+REQUIRED_FUNCTIONS = (
+    "findAncestors",  # Function to find ancestor nodes
+    "findDescendants",  # Function to find descendant nodes
+    "findAllReachableNodes",  # Main function that combines both
+)
+ALGORITHM_KEYWORDS = (
+    "edge.source_name === currentId",  # Forward dependency traversal
+    "edge.target_name === currentId",  # Backward dependency traversal
+    "visited.has(currentId)",  # Cycle prevention
+)
+CSS_KEYWORDS = ("path-highlighted", "orange", "blue")
+
 
 def test_performance_hotspot_detection():
     """Test performance hotspot detection integration."""
@@ -20,40 +53,21 @@ def test_performance_hotspot_detection():
         analyzer = EnhancedDependencyAnalyzer()
 
         # Check that performance analysis methods exist
-        required_methods = [
-            "_analyze_performance_hotspots",
-            "_calculate_complexity_metrics",
-            "_calculate_performance_score",
-            "_calculate_max_nesting_depth",
-        ]
-
-        for method in required_methods:
+        for method in REQUIRED_METHODS:
             assert hasattr(analyzer, method), f"Missing {method} method"
 
         print("✅ All performance analysis methods present")
 
         # Test with a real file
         test_file = Path(__file__)
-        with open(test_file, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = test_file.read_bytes()  # ast.parse takes bytes, skip decoding
 
         metrics = analyzer._calculate_complexity_metrics(content, test_file)
         score = analyzer._calculate_performance_score(metrics)
 
         # Validate metric structure
-        expected_keys = {
-            "total_lines",
-            "code_lines",
-            "function_count",
-            "class_count",
-            "cyclomatic_complexity",
-            "heavy_operations",
-            "max_nesting_depth",
-            "file_size_kb",
-        }
-        assert all(
-            key in metrics for key in expected_keys
-        ), f"Missing metric keys: {expected_keys - set(metrics.keys())}"
+        missing_keys = EXPECTED_METRIC_KEYS - metrics.keys()
+        assert not missing_keys, f"Missing metric keys: {missing_keys}"
 
         assert 0 <= score <= 1, f"Performance score should be 0-1, got {score}"
 
@@ -76,33 +90,17 @@ def test_corrected_path_highlighting():
 
         js_content = graph_visualization.get_graph_visualization_js()
 
-        # Check for corrected algorithm components
-        required_functions = [
-            "findAncestors",  # Function to find ancestor nodes
-            "findDescendants",  # Function to find descendant nodes
-            "findAllReachableNodes",  # Main function that combines both
-        ]
-
-        for func in required_functions:
+        for func in REQUIRED_FUNCTIONS:
             assert func in js_content, f"Missing {func} function"
 
         print("✅ Direct lineage functions present")
 
-        # Check for proper algorithm logic keywords
-        algorithm_keywords = [
-            "edge.source_name === currentId",  # Forward dependency traversal
-            "edge.target_name === currentId",  # Backward dependency traversal
-            "visited.has(currentId)",  # Cycle prevention
-        ]
-
-        for keyword in algorithm_keywords:
+        for keyword in ALGORITHM_KEYWORDS:
             assert keyword in js_content, f"Missing algorithm logic: {keyword}"
 
         print("✅ Direct lineage algorithm logic verified")
 
-        # Check for path highlighting CSS classes
-        css_keywords = ["path-highlighted", "orange", "blue"]
-        css_present = any(keyword in js_content for keyword in css_keywords)
+        css_present = any(keyword in js_content for keyword in CSS_KEYWORDS)
         assert css_present, "Missing path highlighting CSS references"
 
         print("✅ Path highlighting styling integration verified")
@@ -198,4 +196,6 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    with buffered_stdout():
+        exit_code = main()
+    sys.exit(exit_code)
@@ -6,8 +6,48 @@ Final verification test for the dual-layout circle implementation
 import os
 import sys
 
-# Add the current directory to the path
-sys.path.insert(0, os.path.dirname(__file__))
+# Add the current directory to the path, once per process
+SCRIPT_DIR = os.path.dirname(__file__)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from validation_helpers import buffered_stdout
+
+# Digest of the inputs the HTML in graph_output was generated from
+BUILD_STAMP = ".build_stamp"
+
+# Circle checks as (label, source, markers); a check passes when every
+# marker occurs in the named source
+CIRCLE_CHECKS = (
+    # Core circle functionality
+    ("✅ Circle nodes in force layout", "viz", ('node.append("circle")',)),
+    ("✅ Circle radius calculation", "viz", ("calculateCircleRadius",)),
+    ("✅ Importance-based sizing", "viz", ("importance * 1.5",)),
+    ("✅ Circle class assignment", "viz", ("node-circle",)),
+    # Layout switching
+    ("✅ Container switching", "viz", ('hierarchicalContainer.style("display"',)),
+    (
+        "✅ Force container management",
+        "viz",
+        ('forceDirectedContainer.style("display"',),
+    ),
+    ("✅ Simplified switchToLayout", "controls", ("window.switchToLayout",)),
+    # CSS circle support
+    ("✅ Circle CSS styles", "styles", (".node-circle",)),
+    ("✅ Unified transparency", "styles", ("--dimmed-opacity",)),
+    # Layout separation
+    ("✅ Hierarchical rectangles", "viz", ("initializeHierarchicalLayout",)),
+    ("✅ Force-directed circles", "viz", ("initializeForceDirectedLayoutNodes",)),
+    (
+        "✅ Separate containers",
+        "viz",
+        ("hierarchicalContainer", "forceDirectedContainer"),
+    ),
+    # Helper functions
+    ("✅ Circle change badges", "viz", ("addCircleChangeBadges",)),
+    ("✅ Hierarchical indicators", "viz", ("addHierarchicalIndicators",)),
+    ("✅ Common node labels", "viz", ("addNodeLabels",)),
+)
 
 
 def test_circle_implementation():
@@ -20,45 +60,16 @@ def test_circle_implementation():
         from graph_modules.graph_controls import get_graph_controls_js
         from graph_modules.graph_styles import get_graph_styles
 
-        viz_js = get_graph_visualization_js()
-        controls_js = get_graph_controls_js()
-        styles_css = get_graph_styles()
+        sources = {
+            "viz": get_graph_visualization_js(),
+            "controls": get_graph_controls_js(),
+            "styles": get_graph_styles(),
+        }
 
         # Key functionality tests
         tests = [
-            # Core circle functionality
-            ("✅ Circle nodes in force layout", 'node.append("circle")' in viz_js),
-            ("✅ Circle radius calculation", "calculateCircleRadius" in viz_js),
-            ("✅ Importance-based sizing", "importance * 1.5" in viz_js),
-            ("✅ Circle class assignment", "node-circle" in viz_js),
-            # Layout switching
-            (
-                "✅ Container switching",
-                'hierarchicalContainer.style("display"' in viz_js,
-            ),
-            (
-                "✅ Force container management",
-                'forceDirectedContainer.style("display"' in viz_js,
-            ),
-            ("✅ Simplified switchToLayout", "window.switchToLayout" in controls_js),
-            # CSS circle support
-            ("✅ Circle CSS styles", ".node-circle" in styles_css),
-            ("✅ Unified transparency", "--dimmed-opacity" in styles_css),
-            # Layout separation
-            ("✅ Hierarchical rectangles", "initializeHierarchicalLayout" in viz_js),
-            (
-                "✅ Force-directed circles",
-                "initializeForceDirectedLayoutNodes" in viz_js,
-            ),
-            (
-                "✅ Separate containers",
-                "hierarchicalContainer" in viz_js
-                and "forceDirectedContainer" in viz_js,
-            ),
-            # Helper functions
-            ("✅ Circle change badges", "addCircleChangeBadges" in viz_js),
-            ("✅ Hierarchical indicators", "addHierarchicalIndicators" in viz_js),
-            ("✅ Common node labels", "addNodeLabels" in viz_js),
+            (test_name, all(marker in sources[source] for marker in markers))
+            for test_name, source, markers in CIRCLE_CHECKS
         ]
 
         passed = 0
@@ -98,11 +109,27 @@ def test_html_generation():
     print("-" * 40)
 
     try:
-        # Import and run the main script
-        import enhanced_dependency_graph_modular
+        from graph_modules.html_generator import compute_input_digest, get_output_dir
+
+        # Regenerate only when the sources changed since the last build
+        output_dir = get_output_dir()
+        html_path = output_dir / "enhanced_dependency_graph.html"
+        stamp_path = output_dir / BUILD_STAMP
+        digest = compute_input_digest(".")
+
+        if (
+            html_path.exists()
+            and stamp_path.exists()
+            and stamp_path.read_text() == digest
+        ):
+            print("⚡ Inputs unchanged - reusing generated HTML")
+        else:
+            from graph_modules import main as generate_graph
+
+            generate_graph(".")
+            stamp_path.write_text(digest)
 
         # Check if HTML file was created
-        html_path = "graph_output/enhanced_dependency_graph.html"
         if os.path.exists(html_path):
             with open(html_path, "r", encoding="utf-8") as f:
                 content = f.read()
@@ -173,5 +200,6 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
+    with buffered_stdout():
+        success = main()
     sys.exit(0 if success else 1)
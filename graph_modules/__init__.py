@@ -22,8 +22,26 @@ Usage:
 __version__ = "1.0.0"
 __author__ = "Enhanced Dependency Graph System"
 
-# Import main components for easy access
-from .dependency_analyzer import EnhancedDependencyAnalyzer
-from .html_generator import generate_enhanced_html_visualization, main
+import importlib
+
+# Main components for easy access, imported from their submodule on first
+# use (PEP 562) so that importing the package itself stays cheap
+_LAZY_EXPORTS = {
+    "EnhancedDependencyAnalyzer": ".dependency_analyzer",
+    "generate_enhanced_html_visualization": ".html_generator",
+    "main": ".html_generator",
+}
 
 __all__ = ["EnhancedDependencyAnalyzer", "generate_enhanced_html_visualization", "main"]
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
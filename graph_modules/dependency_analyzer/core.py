@@ -7,24 +7,133 @@ Handles project scanning, file registry building, and orchestrating the analysis
 """
 
 import ast
+import hashlib
+import json
 import os
+import sys
+import tempfile
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
 
 from ..git_analysis import GitAnalyzer
-from .import_resolver import ImportResolver
-from .metrics import PerformanceAnalyzer, ImportanceCalculator
+from .import_resolver import ImportResolver, import_names
+from .metrics import PerformanceAnalyzer, ImportanceCalculator, file_complexity_metrics
+
+try:
+    import numpy as np  # Optional: contiguous index arrays for the import graph
+except ImportError:
+    np = None
+
+# Per-project scan results kept between runs, next to the CLI output cache
+SCAN_CACHE_DIR = Path(tempfile.gettempdir()) / "depgraph-cache"
+# Bump whenever scan_file or import_names would produce different results
+SCAN_CACHE_VERSION = 3
+# Files handed to a worker process per task while the walk continues
+SCAN_BATCH_SIZE = 32
+
+# Predefined color palette for consistent visualization
+FOLDER_COLOR_PALETTE = (
+    "#FF6B6B",
+    "#4ECDC4",
+    "#45B7D1",
+    "#96CEB4",
+    "#FFEAA7",
+    "#DDA0DD",
+    "#FFB347",
+    "#87CEEB",
+    "#DEB887",
+    "#F0E68C",
+    "#FFA07A",
+    "#20B2AA",
+    "#87CEFA",
+    "#778899",
+    "#B0C4DE",
+    "#FFFFE0",
+    "#00CED1",
+    "#FF7F50",
+    "#6495ED",
+    "#DC143C",
+)
+
+# Shared placeholder for imports until the second pass; immutable, so no
+# entry can change it for the others, and it serializes as []
+NO_IMPORTS = ()
+
+
+def scan_file(
+    path_str: str,
+) -> Tuple[Optional[int], Optional[List[str]], Optional[str], tuple]:
+    """Read and parse one file, returning (size, import names, error, measured).
+
+    Runs in worker processes, so failures are returned rather than raised:
+    size is None when the file could not be read, and import names are
+    None when it could not be parsed. measured is the (metrics, error)
+    pair of file_complexity_metrics for the hotspot pass, computed from
+    the same read and parse.
+    """
+    try:
+        # One binary read shared by the registry and hotspot passes
+        with open(path_str, "rb") as f:
+            raw = f.read()
+    except Exception as e:
+        return None, None, str(e), (None, str(e))
+
+    # The hotspot metrics drop undecodable bytes and translate newlines,
+    # as reading the file in text mode would
+    text = raw.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    try:
+        content = raw.decode("utf-8")
+    except Exception as e:
+        measured = file_complexity_metrics(path_str, text, file_size=len(raw))
+        return None, None, str(e), measured
+
+    # Size in characters as text mode reads them, where each \r\n is one \n
+    size = len(content) - raw.count(b"\r\n")
+
+    try:
+        tree = ast.parse(text, filename=path_str)
+    except Exception as e:
+        tree = None
+        error = str(e)
+    measured = file_complexity_metrics(path_str, text, tree, len(raw))
+
+    if tree is None:
+        return size, None, error, measured
+    return size, import_names(tree), None, measured
+
+
+def scan_files(paths: List[str]) -> List[tuple]:
+    """Run scan_file over a batch of paths; one worker task per batch."""
+    return [scan_file(path) for path in paths]
 
 
 class EnhancedDependencyAnalyzer:
     """Enhanced dependency analyzer with complete directory inclusion."""
 
-    def __init__(self, exclude_folders: List[str] = None):
-        # Only exclude cache directories by default - be more targeted
-        self.exclude_folders = exclude_folders or ["__pycache__"]
+    def __init__(
+        self,
+        exclude_folders: List[str] = None,
+        jobs: int = None,
+        use_cache: bool = True,
+    ):
+        # Only exclude caches and archived copies by default - be more targeted
+        self.exclude_folders = exclude_folders or ["__pycache__", "archived_duplicates"]
+        # Worker processes for parsing; None uses every core, 1 stays serial
+        self.jobs = jobs
+        # Reuse scan results of files whose mtime and size are unchanged
+        self.use_cache = use_cache
         self.dependencies = {}
+        self._import_cache = {}  # unique_id -> (file_path, imports) between passes
+        self._metrics_cache = []  # (metrics, error) per scanned file, for hotspots
         self.node_importance = {}
         self.root_path = None  # Will be set in analyze_project
+        self._root_prefix = None  # Case-normalized "root_path + os.sep"
         self.git_analyzer = None  # Will be initialized in analyze_project
 
         # Initialize helper components
@@ -32,31 +141,43 @@ class EnhancedDependencyAnalyzer:
         self.performance_analyzer = PerformanceAnalyzer(self)
         self.importance_calculator = ImportanceCalculator(self)
 
+        # Integer-indexed import graph (node_ids, node_index, import_indptr,
+        # import_indices, import_counts), empty until the registry is built
+        self.build_import_graph()
+
     def analyze_project(self, root_path: str = ".") -> Dict[str, Any]:
         """Analyze entire project including previously excluded directories."""
         # Store root_path for use in other methods - use provided path strictly
         self.root_path = Path(root_path).resolve()
+        self._root_prefix = os.path.normcase(
+            str(self.root_path).rstrip(os.sep) + os.sep
+        )
         print(f"🔍 Enhanced dependency analysis starting at: {self.root_path}")
         print("🔍 Including ALL directories...")
 
         # Initialize git analyzer
-        self.git_analyzer = GitAnalyzer(self.root_path)
+        self.git_analyzer = GitAnalyzer(self.root_path, use_cache=self.use_cache)
 
-        # Scan for all Python files
-        python_files = self._find_python_files(root_path)
+        # First pass: Find all Python files and build the file registry,
+        # parsing each file once while the walk is still running
+        python_files = self._build_file_registry(self._walk_python_files(root_path))
         print(f"📁 Found {len(python_files)} Python files across all directories")
+        self.import_resolver.build_index()
 
-        # First pass: Build file registry without dependencies
-        self._build_file_registry(python_files)
-
-        # Second pass: Analyze dependencies now that registry is complete
-        self._analyze_dependencies(python_files)
+        # Second pass: Resolve the collected imports now that the registry is
+        # complete
+        self._analyze_dependencies()
+        self.build_import_graph()
 
         # Calculate node importance (PageRank-style)
         self.importance_calculator.calculate_node_importance()
 
-        # Analyze performance characteristics
-        self.performance_analyzer.analyze_performance_hotspots(python_files)
+        # Analyze performance characteristics from the metrics the first
+        # pass computed while each file was in memory
+        self.performance_analyzer.analyze_performance_hotspots(
+            python_files, self._metrics_cache
+        )
+        self._metrics_cache = []
 
         # Analyze git history for change patterns
         git_analysis = self._analyze_git_history()
@@ -68,112 +189,318 @@ class EnhancedDependencyAnalyzer:
 
     def _find_python_files(self, root_path: str) -> List[Path]:
         """Find all Python files, including in previously excluded directories."""
-        python_files = []
-        root = Path(root_path)
+        return [Path(path) for path in self._walk_python_files(root_path)]
 
-        for file_path in root.rglob("*.py"):
-            # Skip files in excluded directories (more targeted exclusion)
-            should_exclude = False
-            for parent in file_path.parents:
-                if parent.name in self.exclude_folders:
-                    should_exclude = True
-                    break
+    def _walk_python_files(self, root_path: str) -> Iterator[str]:
+        """Yield Python file paths under root_path in rglob order.
 
-            if should_exclude:
-                continue
+        An iterative os.scandir walk that never enters excluded folders and
+        reuses each entry's type from readdir instead of stat-ing it.
+        Directories are visited depth-first, each directory's files before
+        its subdirectories, matching the order Path.rglob produced.
+        """
+        excluded = frozenset(self.exclude_folders)
+        stack = [os.fspath(root_path)]
 
-            # Skip hidden files
-            if file_path.name.startswith("."):
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except PermissionError:
                 continue
 
-            python_files.append(file_path)
+            subdirectories = []
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip excluded directories (more targeted exclusion)
+                    if name not in excluded:
+                        subdirectories.append(entry.path)
+                # Skip hidden files
+                elif name.endswith(".py") and not name.startswith("."):
+                    yield entry.path
+
+            stack.extend(reversed(subdirectories))
+
+    def _scan_files(self, paths: Iterable[str]) -> Tuple[List[Path], List[tuple]]:
+        """Read and parse files as the walk yields them, reusing cached scans.
+
+        A file is unchanged when its mtime and size match the cached entry;
+        everything else is parsed in batches of SCAN_BATCH_SIZE, handed to
+        the worker pool while the walk is still running. The pool is only
+        started once a full batch is pending, so small trees are parsed
+        serially. Only successful scans are cached, so unreadable or
+        unparsable files report their error on every run.
+
+        Returns the discovered files and their scans, in walk order.
+        """
+        cache = self._load_scan_cache() if self.use_cache else {}
 
-        return python_files
-
-    def _build_file_registry(self, python_files: List[Path]) -> None:
-        """Build initial file registry without dependencies (first pass)."""
-        for file_path in python_files:
+        python_files = []
+        scans = []
+        stat_keys = {}
+        batch = []
+        submitted = []  # (scan indices, future or list of scans)
+        executor = None
+        try:
+            for path in paths:
+                i = len(python_files)
+                python_files.append(Path(path))
+                scans.append(None)
+
+                absolute_path = os.path.abspath(path)
+                try:
+                    stat = os.stat(path)
+                    stat_keys[absolute_path] = [stat.st_mtime_ns, stat.st_size]
+                    entry = cache.get(absolute_path)
+                    if entry is not None and entry[:2] == stat_keys[absolute_path]:
+                        scans[i] = (entry[2], entry[3], None, (entry[4], None))
+                        continue
+                except OSError:
+                    pass
+
+                batch.append((i, path))
+                if len(batch) == SCAN_BATCH_SIZE:
+                    if executor is None and self.jobs != 1:
+                        executor = ProcessPoolExecutor(
+                            max_workers=self.jobs or os.cpu_count()
+                        )
+                    submitted.append(self._submit_batch(executor, batch))
+                    batch = []
+
+            if batch:
+                submitted.append(self._submit_batch(executor, batch))
+
+            for indices, result in submitted:
+                if not isinstance(result, list):
+                    result = result.result()
+                for i, scan in zip(indices, result):
+                    scans[i] = scan
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if self.use_cache and submitted:
+            entries = {}
+            for file_path, (size, all_imports, _, (metrics, _)) in zip(
+                python_files, scans
+            ):
+                absolute_path = os.path.abspath(file_path)
+                if (
+                    all_imports is not None
+                    and metrics is not None
+                    and absolute_path in stat_keys
+                ):
+                    entries[absolute_path] = stat_keys[absolute_path] + [
+                        size,
+                        all_imports,
+                        metrics,
+                    ]
+            self._save_scan_cache(entries)
+
+        return python_files, scans
+
+    @staticmethod
+    def _submit_batch(executor: Optional[ProcessPoolExecutor], batch: List[tuple]):
+        """Parse a batch of (index, path) pairs in the pool, or here without one."""
+        indices = [i for i, _ in batch]
+        paths = [path for _, path in batch]
+        if executor is None:
+            return indices, scan_files(paths)
+        return indices, executor.submit(scan_files, paths)
+
+    def _scan_cache_path(self) -> Path:
+        """Return the scan cache file for the current root_path."""
+        root_digest = hashlib.blake2b(
+            str(self.root_path).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        return SCAN_CACHE_DIR / f"scan-{root_digest}.json"
+
+    def _load_scan_cache(self) -> Dict[str, list]:
+        """Load cached [mtime_ns, st_size, size, imports, metrics] records."""
+        try:
+            with open(self._scan_cache_path(), "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if cache.get("version") != SCAN_CACHE_VERSION:
+            return {}
+        return cache.get("files", {})
+
+    def _save_scan_cache(self, entries: Dict[str, list]) -> None:
+        """Atomically replace the scan cache; failures only cost a re-parse."""
+        cache_path = self._scan_cache_path()
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            SCAN_CACHE_DIR.mkdir(exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": SCAN_CACHE_VERSION, "files": entries},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not write scan cache {cache_path}: {e}")
+
+    def _build_file_registry(self, python_files: Iterable) -> List[Path]:
+        """Build initial file registry and parse each file (first pass).
+
+        Each file is read and parsed once by _scan_files; its import names
+        are kept in self._import_cache for the dependency pass and its
+        complexity metrics in self._metrics_cache for the hotspot pass.
+        python_files may be a lazy walk; the files it yielded are returned
+        as a list.
+        """
+        self._import_cache = {}
+        python_files, scans = self._scan_files(python_files)
+        self._metrics_cache = [scan[3] for scan in scans]
+
+        for file_path, (size, all_imports, error, _) in zip(python_files, scans):
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # Resolve path relative to root for consistent folder detection
-                resolved_relative_path = file_path.resolve().relative_to(self.root_path)
+                if size is None:
+                    raise OSError(error)
+
+                # Resolve path relative to root for consistent folder detection.
+                # Walked paths under the root are already relative to it once
+                # the root prefix is cut off, so only symlinked files and
+                # paths outside the root go through Path.resolve
+                relative_path = self._relative_to_root(file_path)
+                if relative_path is None or os.path.islink(file_path):
+                    resolved_relative_path = file_path.resolve().relative_to(
+                        self.root_path
+                    )
+                else:
+                    resolved_relative_path = Path(relative_path)
 
-                # Create unique identifier
-                unique_id = self.create_unique_id(file_path)
+                # Create unique identifier from the same relative path, as
+                # create_unique_id would
+                unique_id = (relative_path or str(file_path)).replace("\\", "/")
 
+                # Folders and common stems repeat across many files, so share
+                # one string object per distinct value
                 self.dependencies[unique_id] = {
                     "file_path": str(resolved_relative_path),
-                    "folder": self.get_folder_name_from_relative_path(
-                        resolved_relative_path
+                    "folder": sys.intern(
+                        self.get_folder_name_from_relative_path(resolved_relative_path)
                     ),
-                    "stem": file_path.stem,
+                    "stem": sys.intern(file_path.stem),
                     "display_name": self.create_display_name_from_relative_path(
                         resolved_relative_path
                     ),
-                    "imports": [],  # Will be filled in second pass
-                    "all_imports": [],  # Will be filled in second pass
+                    "imports": NO_IMPORTS,  # Will be filled in second pass
+                    "all_imports": NO_IMPORTS,  # Will be filled in second pass
                     "imports_count": 0,  # Will be filled in second pass
                     "internal_imports_count": 0,  # Will be filled in second pass
-                    "is_test": self.is_test_file(file_path),
+                    "is_test": self.is_test_file(
+                        file_path, self._folder_of(relative_path)
+                    ),
                     "is_init": file_path.name == "__init__.py",
-                    "size": len(content),
+                    "size": size,
                 }
 
             except Exception as e:
                 print(f"Error registering {file_path}: {e}")
+                continue
+
+            if all_imports is None:
+                print(f"Error analyzing dependencies for {file_path}: {error}")
+            else:
+                self._import_cache[unique_id] = (file_path, all_imports)
+
+        return python_files
 
-    def _analyze_dependencies(self, python_files: List[Path]) -> None:
+    def _analyze_dependencies(self) -> None:
         """Analyze dependencies with enhanced import detection (second pass)."""
-        for file_path in python_files:
+        for unique_id, (file_path, all_imports) in self._import_cache.items():
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # Parse AST for accurate import analysis
-                tree = ast.parse(content, filename=str(file_path))
-                internal_imports, all_imports = self.import_resolver.extract_imports(
-                    tree, file_path
+                internal_imports, all_imports = self.import_resolver.resolve_imports(
+                    all_imports, file_path
                 )
 
                 # Update existing entry with dependency information
-                unique_id = self.create_unique_id(file_path)
-                if unique_id in self.dependencies:
-                    self.dependencies[unique_id].update(
-                        {
-                            "imports": internal_imports,
-                            "all_imports": all_imports,
-                            "imports_count": len(all_imports),
-                            "internal_imports_count": len(internal_imports),
-                        }
-                    )
+                self.dependencies[unique_id].update(
+                    {
+                        "imports": internal_imports,
+                        "all_imports": all_imports,
+                        "imports_count": len(all_imports),
+                        "internal_imports_count": len(internal_imports),
+                    }
+                )
 
             except Exception as e:
                 print(f"Error analyzing dependencies for {file_path}: {e}")
 
+        # The import names are only needed for resolution
+        self._import_cache = {}
+
+    def _relative_to_root(self, file_path: Path) -> Optional[str]:
+        """Return file_path relative to the root, or None if it lies outside.
+
+        Plain string prefix test in place of Path.relative_to, which is far
+        slower and is hit several times per file.
+        """
+        path = str(file_path)
+        if self._root_prefix is None:
+            # No root yet - paths are relative to the current directory
+            return None if os.path.isabs(path) else path
+        if os.path.normcase(path).startswith(self._root_prefix):
+            return path[len(self._root_prefix) :]
+        return None
+
+    def build_import_graph(self) -> None:
+        """Number the registry and store resolved imports as CSR index arrays.
+
+        Node i is node_ids[i]; its registered imports are
+        import_indices[import_indptr[i]:import_indptr[i + 1]] in import
+        order, repeats kept, and import_counts[i] counts all of its resolved
+        imports, registered or not. The arrays are numpy int64 when numpy
+        is available and plain lists otherwise.
+        """
+        self.node_ids = list(self.dependencies)
+        self.node_index = {unique_id: i for i, unique_id in enumerate(self.node_ids)}
+
+        indptr = [0]
+        indices = []
+        counts = []
+        for info in self.dependencies.values():
+            imports = info["imports"]
+            indices.extend(
+                self.node_index[target]
+                for target in imports
+                if target in self.node_index
+            )
+            indptr.append(len(indices))
+            counts.append(len(imports))
+
+        if np is not None:
+            indptr = np.array(indptr, dtype=np.int64)
+            indices = np.array(indices, dtype=np.int64)
+            counts = np.array(counts, dtype=np.int64)
+        self.import_indptr = indptr
+        self.import_indices = indices
+        self.import_counts = counts
+
     def create_unique_id(self, file_path: Path) -> str:
         """Create a unique identifier for a file."""
-        try:
-            # Use the stored root_path if available, otherwise fall back to current directory
-            root = self.root_path if self.root_path else Path(".")
-            relative_path = file_path.relative_to(root)
-            return str(relative_path).replace("\\", "/")
-        except ValueError:
-            return str(file_path).replace("\\", "/")
+        relative_path = self._relative_to_root(file_path)
+        if relative_path is None:
+            relative_path = str(file_path)
+        return relative_path.replace("\\", "/")
 
     def get_folder_name(self, file_path: Path) -> str:
         """Enhanced folder name detection."""
-        try:
-            # Use the stored root_path if available, otherwise fall back to current directory
-            root = self.root_path if self.root_path else Path(".")
-            relative_path = file_path.relative_to(root)
-            if len(relative_path.parts) > 1:
-                return relative_path.parts[0]
-            else:
-                return "root"
-        except ValueError:
+        return self._folder_of(self._relative_to_root(file_path))
+
+    @staticmethod
+    def _folder_of(relative_path: Optional[str]) -> str:
+        """Return the top-level folder of a _relative_to_root result."""
+        if relative_path is None:
             return "external"
+        folder, separator, _ = relative_path.partition(os.sep)
+        return folder if separator else "root"
 
     def create_display_name(self, file_path: Path) -> str:
         """Create a human-readable display name."""
@@ -202,21 +529,21 @@ class EnhancedDependencyAnalyzer:
         else:
             return f"{folder}/{stem}"
 
-    def is_test_file(self, file_path: Path) -> bool:
-        """Enhanced test file detection."""
-        stem = file_path.stem.lower()
-        folder = self.get_folder_name(file_path).lower()
+    def is_test_file(self, file_path: Path, folder: Optional[str] = None) -> bool:
+        """Enhanced test file detection.
 
-        # Check file name patterns
-        test_patterns = [
-            stem.startswith("test_"),
-            stem.endswith("_test"),
-            stem == "test",
-            "test" in folder,
-            folder.startswith("test"),
-        ]
+        Callers that already know get_folder_name(file_path) pass it as
+        folder so the root-relative path is not worked out again.
+        """
+        stem = file_path.stem.lower()
 
-        return any(test_patterns)
+        # Check file name patterns before looking up the folder; a folder
+        # starting with "test" also contains it
+        if stem.startswith("test_") or stem.endswith("_test") or stem == "test":
+            return True
+        if folder is None:
+            folder = self.get_folder_name(file_path)
+        return "test" in folder.lower()
 
     def _analyze_git_history(self, days: int = 30) -> Dict[str, Any]:
         """Analyze git history for change patterns and hotspots."""
@@ -243,9 +570,19 @@ class EnhancedDependencyAnalyzer:
         folders = set(info["folder"] for info in self.dependencies.values())
         folder_colors = self._generate_folder_colors(folders)
 
+        # Registries filled in by hand have not been numbered yet
+        if len(self.node_ids) != len(self.dependencies):
+            self.build_import_graph()
+
         nodes = []
         edges = []
-        node_index = {}
+        nodes_by_folder = defaultdict(list)
+        # Statistics counted while the nodes and edges are built
+        test_files = 0
+        cross_folder_dependencies = 0
+
+        # Git analysis data per file, if any
+        git_file_data = (git_analysis or {}).get("file_data") or {}
 
         # Create nodes with enhanced properties
         for i, (unique_id, info) in enumerate(self.dependencies.items()):
@@ -253,9 +590,9 @@ class EnhancedDependencyAnalyzer:
 
             # Get git analysis data for this file
             git_data = {}
-            if git_analysis and git_analysis.get("file_data"):
+            if git_file_data:
                 file_path_normalized = info["file_path"].replace("\\", "/")
-                git_data = git_analysis["file_data"].get(file_path_normalized, {})
+                git_data = git_file_data.get(file_path_normalized, {})
 
             # Get performance metrics for this file
             perf_data = self.performance_analyzer.performance_metrics.get(unique_id, {})
@@ -300,37 +637,43 @@ class EnhancedDependencyAnalyzer:
                     "max_nesting_depth": perf_data.get("max_nesting_depth", 0),
                 }
             )
-            node_index[unique_id] = i
+            nodes_by_folder[info["folder"]].append(nodes[-1])
+            if info["is_test"]:
+                test_files += 1
 
-        # Create edges with enhanced properties
-        for unique_id, info in self.dependencies.items():
-            source_index = node_index[unique_id]
-            source_folder = info["folder"]
+        # Create edges with enhanced properties from the numbered import graph
+        infos = list(self.dependencies.values())
+        indptr, indices = self.import_indptr, self.import_indices
+        if np is not None:
+            indptr, indices = indptr.tolist(), indices.tolist()
 
-            for imported_id in info["imports"]:
-                if imported_id in node_index:
-                    target_index = node_index[imported_id]
-                    target_info = self.dependencies[imported_id]
-                    target_folder = target_info["folder"]
-
-                    edges.append(
-                        {
-                            "source": source_index,
-                            "target": target_index,
-                            "source_name": unique_id,
-                            "target_name": imported_id,
-                            "source_folder": source_folder,
-                            "target_folder": target_folder,
-                            "is_cross_folder": source_folder != target_folder,
-                            "is_test_related": info["is_test"]
-                            or target_info["is_test"],
-                        }
-                    )
+        for source_index, (unique_id, info) in enumerate(zip(self.node_ids, infos)):
+            source_folder = info["folder"]
+            start, end = indptr[source_index], indptr[source_index + 1]
+
+            for target_index in indices[start:end]:
+                target_info = infos[target_index]
+                target_folder = target_info["folder"]
+                is_cross_folder = source_folder != target_folder
+                cross_folder_dependencies += is_cross_folder
+
+                edges.append(
+                    {
+                        "source": source_index,
+                        "target": target_index,
+                        "source_name": unique_id,
+                        "target_name": self.node_ids[target_index],
+                        "source_folder": source_folder,
+                        "target_folder": target_folder,
+                        "is_cross_folder": is_cross_folder,
+                        "is_test_related": info["is_test"] or target_info["is_test"],
+                    }
+                )
 
         # Build subfolder info
         subfolder_info = {}
         for folder, color in folder_colors.items():
-            folder_modules = [n for n in nodes if n["folder"] == folder]
+            folder_modules = nodes_by_folder[folder]
             subfolder_info[folder] = {
                 "color": color,
                 "modules": [n["name"] for n in folder_modules],
@@ -348,10 +691,8 @@ class EnhancedDependencyAnalyzer:
             "statistics": {
                 "total_files": len(nodes),
                 "total_dependencies": len(edges),
-                "cross_folder_dependencies": sum(
-                    1 for e in edges if e["is_cross_folder"]
-                ),
-                "test_files": sum(1 for n in nodes if n["is_test"]),
+                "cross_folder_dependencies": cross_folder_dependencies,
+                "test_files": test_files,
                 "folders": len(subfolder_info),
                 "git_analysis_available": git_analysis is not None
                 and git_analysis.get("git_available", False),
@@ -365,35 +706,24 @@ class EnhancedDependencyAnalyzer:
         }
 
     def _generate_folder_colors(self, folders: Set[str]) -> Dict[str, str]:
-        """Generate visually distinct colors for folders."""
-        # Predefined color palette for consistent visualization
-        color_palette = [
-            "#FF6B6B",
-            "#4ECDC4",
-            "#45B7D1",
-            "#96CEB4",
-            "#FFEAA7",
-            "#DDA0DD",
-            "#FFB347",
-            "#87CEEB",
-            "#DEB887",
-            "#F0E68C",
-            "#FFA07A",
-            "#20B2AA",
-            "#87CEFA",
-            "#778899",
-            "#B0C4DE",
-            "#FFFFE0",
-            "#00CED1",
-            "#FF7F50",
-            "#6495ED",
-            "#DC143C",
-        ]
-
-        folder_list = sorted(folders)
+        """Generate visually distinct colors for folders.
+
+        Each folder starts from a palette slot picked by a stable hash of its
+        name, so its color does not depend on which other folders exist.
+        While the palette has free colors, a folder whose slot is taken moves
+        to the next free one, in sorted folder order, so folders stay
+        distinguishable.
+        """
+        palette_size = len(FOLDER_COLOR_PALETTE)
         folder_colors = {}
-
-        for i, folder in enumerate(folder_list):
-            folder_colors[folder] = color_palette[i % len(color_palette)]
+        used_slots = set()
+
+        for folder in sorted(folders):
+            slot = zlib.crc32(folder.encode("utf-8")) % palette_size
+            if len(used_slots) < palette_size:
+                while slot in used_slots:
+                    slot = (slot + 1) % palette_size
+            used_slots.add(slot)
+            folder_colors[folder] = FOLDER_COLOR_PALETTE[slot]
 
         return folder_colors
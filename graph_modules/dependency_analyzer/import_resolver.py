@@ -7,10 +7,55 @@ Contains logic for resolving relative imports and mapping imports to file IDs.
 """
 
 import ast
+import functools
 import os
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+# Fields holding nested statements, in the order ast.iter_child_nodes
+# yields them; import statements can only appear inside these
+STATEMENT_FIELDS = {
+    ast.FunctionDef: ("body",),
+    ast.AsyncFunctionDef: ("body",),
+    ast.ClassDef: ("body",),
+    ast.For: ("body", "orelse"),
+    ast.AsyncFor: ("body", "orelse"),
+    ast.While: ("body", "orelse"),
+    ast.If: ("body", "orelse"),
+    ast.With: ("body",),
+    ast.AsyncWith: ("body",),
+    ast.Try: ("body", "handlers", "orelse", "finalbody"),
+    ast.ExceptHandler: ("body",),
+}
+if hasattr(ast, "Match"):  # Python 3.10+
+    STATEMENT_FIELDS[ast.Match] = ("cases",)
+    STATEMENT_FIELDS[ast.match_case] = ("body",)
+if hasattr(ast, "TryStar"):  # Python 3.11+
+    STATEMENT_FIELDS[ast.TryStar] = ("body", "handlers", "orelse", "finalbody")
+
+
+def import_names(tree: ast.AST) -> List[str]:
+    """Collect the imported module names of a parsed file in walk order.
+
+    Walks statement blocks breadth-first like ast.walk, so names come out
+    in the same order, but never descends into expressions, which cannot
+    contain imports. Plain function so worker processes can run it
+    without an analyzer.
+    """
+    names = []
+    queue = list(tree.body)
+    for node in queue:  # The list grows while iterating - breadth-first
+        node_type = type(node)
+        if node_type is ast.Import:
+            names.extend(alias.name for alias in node.names)
+        elif node_type is ast.ImportFrom:
+            if node.module:
+                names.append(node.module)
+        else:
+            for field in STATEMENT_FIELDS.get(node_type, ()):
+                queue.extend(getattr(node, field))
+    return names
+
 
 class ImportResolver:
     """Handles import resolution and mapping for dependency analysis."""
@@ -19,47 +64,85 @@ class ImportResolver:
         """Initialize with reference to the main analyzer."""
         self.analyzer = analyzer
 
+        # Lookup tables built by build_index(), keyed by stem, (folder, stem)
+        # and dotted module path; values are (registry position, unique_id)
+        self.stem_index = {}
+        self.folder_stem_index = {}
+        self.module_path_index = {}
+        # Memoized find_module_file and find_relative_file, cleared whenever
+        # build_index() runs
+        self.lookup_module = functools.lru_cache(maxsize=None)(self.find_module_file)
+        self.lookup_relative = functools.lru_cache(maxsize=None)(
+            self.find_relative_file
+        )
+
+    def build_index(self) -> None:
+        """Index the completed file registry for constant-time resolution.
+
+        Each key keeps its first entry in registry order, so a lookup returns
+        the same file the previous linear scan found first.
+        """
+        self.stem_index = {}
+        self.folder_stem_index = {}
+        self.module_path_index = {}
+        # Results memoized against the previous registry are stale now
+        self.lookup_module.cache_clear()
+        self.lookup_relative.cache_clear()
+
+        for position, (unique_id, info) in enumerate(
+            self.analyzer.dependencies.items()
+        ):
+            entry = (position, unique_id)
+            self.stem_index.setdefault(info["stem"], entry)
+            self.folder_stem_index.setdefault((info["folder"], info["stem"]), entry)
+
+            # Convert file path to module notation
+            relative_path = Path(info["file_path"])
+            if relative_path.stem == "__init__":
+                module_path = ".".join(relative_path.parent.parts)
+            else:
+                module_path = ".".join(relative_path.with_suffix("").parts)
+            self.module_path_index.setdefault(module_path, entry)
+
     def extract_imports(
         self, tree: ast.AST, file_path: Path
     ) -> Tuple[List[str], List[str]]:
         """Enhanced import extraction with better resolution."""
+        return self.resolve_imports(import_names(tree), file_path)
+
+    def resolve_imports(
+        self, all_imports: List[str], file_path: Path
+    ) -> Tuple[List[str], List[str]]:
+        """Map a file's imported module names to known file IDs."""
         internal_imports = []
-        all_imports = []
         current_folder = self.analyzer.get_folder_name(file_path)
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    all_imports.append(alias.name)
-                    resolved = self.resolve_import_to_file(alias.name, current_folder)
-                    if resolved:
-                        internal_imports.append(resolved)
-
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    module_name = node.module
-                    all_imports.append(module_name)
-
-                    # Handle relative imports
-                    if module_name.startswith("."):
-                        # Relative import - resolve based on current location
-                        resolved = self.resolve_relative_import(module_name, file_path)
-                        if resolved:
-                            internal_imports.append(resolved)
-                    else:
-                        # Absolute import
-                        resolved = self.resolve_import_to_file(
-                            module_name, current_folder
-                        )
-                        if resolved:
-                            internal_imports.append(resolved)
+        for module_name in all_imports:
+            # Handle relative imports
+            if module_name.startswith("."):
+                # Relative import - resolve based on current location
+                resolved = self.resolve_relative_import(module_name, file_path)
+            else:
+                # Absolute import
+                resolved = self.resolve_import_to_file(module_name, current_folder)
+            if resolved:
+                internal_imports.append(resolved)
 
         return internal_imports, all_imports
 
     def resolve_relative_import(
         self, import_name: str, current_file: Path
     ) -> Optional[str]:
-        """Resolve relative imports to actual file IDs."""
+        """Resolve relative imports to actual file IDs.
+
+        Files of one package share their relative imports, so each name is
+        checked on disk once per directory through the memoized
+        lookup_relative.
+        """
+        return self.lookup_relative(import_name, current_file.parent)
+
+    def find_relative_file(self, import_name: str, current_dir: Path) -> Optional[str]:
+        """Find the file a relative import from current_dir refers to."""
         # Count dots to determine level
         level = 0
         while level < len(import_name) and import_name[level] == ".":
@@ -72,7 +155,7 @@ class ImportResolver:
         module_name = import_name[level:] if level < len(import_name) else ""
 
         # Navigate up the directory tree
-        target_dir = current_file.parent
+        target_dir = current_dir
         for _ in range(level - 1):
             target_dir = target_dir.parent
 
@@ -96,37 +179,28 @@ class ImportResolver:
     def resolve_import_to_file(
         self, import_name: str, current_folder: str
     ) -> Optional[str]:
-        """Enhanced import resolution to map imports to actual files."""
+        """Enhanced import resolution to map imports to actual files.
+
+        The same modules are imported from many files, so each name is
+        looked up once per registry through the memoized lookup_module.
+        """
+        return self.lookup_module(import_name)
+
+    def find_module_file(self, import_name: str) -> Optional[str]:
+        """Find the file an absolute import refers to in the lookup tables."""
         # Check if this import corresponds to any known file
         import_parts = import_name.split(".")
 
-        # Try different combinations to find the actual file
-        for unique_id, info in self.analyzer.dependencies.items():
-            # Direct stem match
-            if info["stem"] == import_parts[0]:
-                return unique_id
-
-            # Try matching with folder structure
-            if len(import_parts) > 1:
-                if (
-                    info["folder"] == import_parts[0]
-                    and info["stem"] == import_parts[1]
-                ):
-                    return unique_id
-
-            # Try matching full module path
-            file_path = Path(info["file_path"])
-            try:
-                # Convert file path to module notation
-                relative_path = file_path.relative_to(Path("."))
-                if relative_path.stem == "__init__":
-                    module_path = ".".join(relative_path.parent.parts)
-                else:
-                    module_path = ".".join(relative_path.with_suffix("").parts)
-
-                if module_path == import_name:
-                    return unique_id
-            except ValueError:
-                pass
-
-        return None
+        # Try direct stem, folder/stem and full module path matches; the
+        # earliest registered file matching any of them wins
+        matches = [
+            self.stem_index.get(import_parts[0]),
+            self.module_path_index.get(import_name),
+        ]
+        if len(import_parts) > 1:
+            matches.append(
+                self.folder_stem_index.get((import_parts[0], import_parts[1]))
+            )
+
+        found = [match for match in matches if match is not None]
+        return min(found)[1] if found else None
@@ -6,9 +6,248 @@ Handles performance analysis, complexity metrics, and importance calculations.
 Contains algorithms for calculating node importance and performance hotspots.
 """
 
+import ast
 import re
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import numpy as np  # Optional: vectorized PageRank and batch scoring
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # Optional: compiled PageRank kernel
+except ImportError:
+    njit = None
+
+# Statements that open a new nested block for the nesting-depth metric
+NESTING_NODES = (
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.If,
+    ast.For,
+    ast.AsyncFor,
+    ast.While,
+    ast.With,
+    ast.AsyncWith,
+    ast.Try,
+)
+
+# Nodes that add a decision point to the cyclomatic complexity estimate
+BRANCH_NODES = (
+    ast.If,
+    ast.For,
+    ast.AsyncFor,
+    ast.While,
+    ast.Try,
+    ast.ExceptHandler,
+    ast.IfExp,
+    ast.Break,
+    ast.Continue,
+)
+
+# Call prefixes treated as performance-heavy operations
+HEAVY_MODULES = {
+    "subprocess",
+    "requests",
+    "urllib",
+    "pandas",
+    "numpy",
+    "scipy",
+    "matplotlib",
+}
+HEAVY_CALLS = ("json.load", "pickle.load", "time.sleep")
+
+# Text fallbacks for files that do not parse, compiled once per process
+FUNCTION_DEF_RE = re.compile(r"^\s*def\s+\w+", re.MULTILINE)
+CLASS_DEF_RE = re.compile(r"^\s*class\s+\w+", re.MULTILINE)
+COMPLEXITY_INDICATORS = (
+    "if ",
+    "elif ",
+    "else:",
+    "for ",
+    "while ",
+    "try:",
+    "except",
+    "and ",
+    "or ",
+    "?",
+    "break",
+    "continue",
+)
+# Counted one pattern at a time: matches of different patterns may overlap
+HEAVY_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\.read\(\)",
+        r"\.write\(\)",
+        r"\.open\(",
+        r"subprocess\.",
+        r"requests\.",
+        r"urllib\.",
+        r"json\.load",
+        r"pickle\.load",
+        r"pandas\.",
+        r"numpy\.",
+        r"scipy\.",
+        r"matplotlib\.",
+        r"for.*in.*range\(.*\d{3,}",
+        r"while.*True:",
+        r"time\.sleep",
+    )
+)
+# Line keywords that open a nested block in the text nesting estimate
+NESTING_KEYWORDS = ("if ", "for ", "while ", "def ", "class ", "with ", "try:")
+
+
+def performance_score_kernel(
+    complexity: float,
+    size_kb: float,
+    heavy_ops: float,
+    nesting: float,
+    functions: float,
+) -> float:
+    """Weighted performance risk score (0-1) from plain numeric metrics.
+
+    Accepts scalars or equally shaped numpy arrays, one value per file.
+    """
+    cap = min if np is None or np.isscalar(complexity) else np.minimum
+    # Each factor saturates at its cap; files over 50KB score full size risk
+    return (
+        cap(complexity / 100, 1.0) * 0.3
+        + cap(size_kb / 50, 1.0) * 0.2
+        + cap(heavy_ops / 10, 1.0) * 0.25
+        + cap(nesting / 8, 1.0) * 0.15
+        + cap(functions / 20, 1.0) * 0.1
+    )
+
+
+def pagerank_kernel(sources, targets, weights, n, damping, max_iter, tol):
+    """Push-style PageRank power iteration over an edge list.
+
+    Edge e passes weights[e] of node sources[e]'s rank to targets[e]. The
+    loop adds edges in order, as np.bincount does, so the compiled and
+    numpy paths produce the same scores. Returns the ranks and the
+    iteration they converged on, or 0 if they did not converge.
+    """
+    importance = np.full(n, 1.0 / n)
+    for iteration in range(max_iter):
+        new_importance = np.full(n, (1 - damping) / n)
+        incoming = np.zeros(n)
+        for e in range(len(targets)):
+            incoming[targets[e]] += weights[e] * importance[sources[e]]
+        new_importance += damping * incoming
+
+        # Check for convergence
+        max_diff = np.abs(new_importance - importance).max()
+        importance = new_importance
+        if max_diff < tol:
+            return importance, iteration + 1
+
+    return importance, 0
+
+
+if njit is not None:
+    pagerank_kernel = njit(cache=True)(pagerank_kernel)
+
+
+def dotted_name(node) -> str:
+    """Return the dotted name of a Name/Attribute chain, or '' if dynamic."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return ""
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def is_elif(node) -> bool:
+    """Check whether an if statement's else branch is a single elif."""
+    return (
+        isinstance(node, ast.If)
+        and len(node.orelse) == 1
+        and isinstance(node.orelse[0], ast.If)
+    )
+
+
+class ComplexityVisitor(ast.NodeVisitor):
+    """Collects every complexity counter in a single walk of a module AST."""
+
+    def __init__(self):
+        self.function_count = 0
+        self.class_count = 0
+        self.cyclomatic_complexity = 0
+        self.heavy_operations = 0
+        self.max_nesting_depth = 0
+        self._depth = 0
+
+    def generic_visit(self, node):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            self.function_count += 1
+        elif isinstance(node, ast.ClassDef):
+            self.class_count += 1
+
+        if isinstance(node, BRANCH_NODES):
+            self.cyclomatic_complexity += 1
+            if getattr(node, "orelse", None) and not is_elif(node):
+                self.cyclomatic_complexity += 1
+        elif isinstance(node, ast.BoolOp):
+            self.cyclomatic_complexity += len(node.values) - 1
+
+        if self._is_heavy(node):
+            self.heavy_operations += 1
+
+        if not isinstance(node, NESTING_NODES):
+            super().generic_visit(node)
+            return
+
+        self._depth += 1
+        self.max_nesting_depth = max(self.max_nesting_depth, self._depth)
+        if is_elif(node):
+            # An elif chain stays at the depth of its leading if
+            self.visit(node.test)
+            for child in node.body:
+                self.visit(child)
+            self._depth -= 1
+            self.visit(node.orelse[0])
+        else:
+            super().generic_visit(node)
+            self._depth -= 1
+
+    @staticmethod
+    def _is_heavy(node) -> bool:
+        """Check whether a node matches one of the heavy operation patterns."""
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Attribute):
+                if func.attr == "open" or (
+                    func.attr in ("read", "write") and not node.args
+                ):
+                    return True
+            name = dotted_name(func)
+            return name.split(".", 1)[0] in HEAVY_MODULES or name.startswith(
+                HEAVY_CALLS
+            )
+        if isinstance(node, ast.While):
+            return isinstance(node.test, ast.Constant) and node.test.value is True
+        if isinstance(node, (ast.For, ast.AsyncFor)):
+            iterator = node.iter
+            return (
+                isinstance(iterator, ast.Call)
+                and dotted_name(iterator.func) == "range"
+                and any(
+                    isinstance(arg, ast.Constant)
+                    and type(arg.value) is int
+                    and arg.value >= 100
+                    for arg in iterator.args
+                )
+            )
+        return False
 
 
 class ImportanceCalculator:
@@ -22,15 +261,47 @@ class ImportanceCalculator:
         """Calculate node importance using PageRank-style algorithm."""
         print("📈 Calculating node importance scores...")
 
-        # Build adjacency matrix
-        nodes = list(self.analyzer.dependencies.keys())
+        # Registries filled in by hand have not been numbered yet
+        if len(self.analyzer.node_ids) != len(self.analyzer.dependencies):
+            self.analyzer.build_import_graph()
+
+        nodes = self.analyzer.node_ids
+        damping = 0.85
+
+        if np is not None:
+            importance = self.power_iteration_sparse(nodes, damping)
+        else:
+            importance = self.power_iteration(nodes, damping)
+
+        # Normalize to 0-1 range
+        max_importance = max(importance.values()) if importance.values() else 1
+        self.analyzer.node_importance = {
+            node: score / max_importance for node, score in importance.items()
+        }
+
+    def power_iteration(self, nodes: List[str], damping: float) -> Dict[str, float]:
+        """Run PageRank iterations over the import graph in pure Python.
+
+        Edges are weighted as in PageRank-IVOL: a file passes rank to each
+        import in proportion to how many of its resolved imports name it,
+        so weight / total out-weight replaces 1 / out-degree.
+        """
         n = len(nodes)
 
+        # Precompute each node's importers and edge weights once, so an
+        # iteration touches every edge once instead of every imports list
+        # per node
+        incoming = {node: [] for node in nodes}
+        for other_node, info in self.analyzer.dependencies.items():
+            total_weight = len(info["imports"])
+            for node, weight in Counter(info["imports"]).items():
+                if node in incoming:
+                    incoming[node].append((other_node, weight / total_weight))
+
         # Initialize importance scores
         importance = {node: 1.0 / n for node in nodes}
 
         # PageRank iterations
-        damping = 0.85
         for iteration in range(50):  # 50 iterations should be sufficient
             new_importance = {}
 
@@ -39,13 +310,8 @@ class ImportanceCalculator:
                 new_importance[node] = (1 - damping) / n
 
                 # Add importance from incoming links
-                for other_node, info in self.analyzer.dependencies.items():
-                    if node in info["imports"]:
-                        outgoing_count = len(info["imports"])
-                        if outgoing_count > 0:
-                            new_importance[node] += (
-                                damping * importance[other_node] / outgoing_count
-                            )
+                for other_node, share in incoming[node]:
+                    new_importance[node] += damping * importance[other_node] * share
 
             # Check for convergence
             max_diff = max(
@@ -57,11 +323,87 @@ class ImportanceCalculator:
                 print(f"   Converged after {iteration + 1} iterations")
                 break
 
-        # Normalize to 0-1 range
-        max_importance = max(importance.values()) if importance.values() else 1
-        self.analyzer.node_importance = {
-            node: score / max_importance for node, score in importance.items()
-        }
+        return importance
+
+    def power_iteration_sparse(
+        self, nodes: List[str], damping: float
+    ) -> Dict[str, float]:
+        """Run PageRank iterations as sparse matrix-vector products in numpy.
+
+        Works on the analyzer's CSR import graph (see build_import_graph),
+        reduced to each node's distinct imports with the same edge weights
+        as power_iteration. Each iteration is then O(E) in C instead of an
+        O(N * E) Python scan.
+        """
+        n = len(nodes)
+        indptr = self.analyzer.import_indptr
+        sources = np.repeat(np.arange(n), np.diff(indptr))
+
+        # Merge repeated (source, target) pairs into one edge whose weight is
+        # the number of repeats, kept in order of first occurrence
+        _, first, repeats = np.unique(
+            sources * n + self.analyzer.import_indices,
+            return_index=True,
+            return_counts=True,
+        )
+        order = np.argsort(first)
+        first = first[order]
+        sources = sources[first]
+        indices = self.analyzer.import_indices[first]
+
+        counts = self.analyzer.import_counts
+        inv_out = np.zeros(n)
+        inv_out[counts > 0] = 1.0 / counts[counts > 0]
+        weights = repeats[order] * inv_out[sources]
+
+        if njit is not None:
+            importance, converged_at = pagerank_kernel(
+                sources, indices, weights, n, damping, 50, 1e-6
+            )
+            if converged_at:
+                print(f"   Converged after {converged_at} iterations")
+            return dict(zip(nodes, importance.tolist()))
+
+        importance = np.full(n, 1.0 / n)
+        for iteration in range(50):  # 50 iterations should be sufficient
+            # Push each node's rank share to its imports in one scatter-add
+            incoming = np.bincount(
+                indices, weights=weights * importance[sources], minlength=n
+            )
+            new_importance = (1 - damping) / n + damping * incoming
+
+            # Check for convergence
+            max_diff = np.abs(new_importance - importance).max()
+            importance = new_importance
+
+            if max_diff < 1e-6:
+                print(f"   Converged after {iteration + 1} iterations")
+                break
+
+        return dict(zip(nodes, importance.tolist()))
+
+
+def file_complexity_metrics(
+    path_str: str,
+    content: Optional[str] = None,
+    tree: Optional[ast.AST] = None,
+    file_size: Optional[int] = None,
+) -> Tuple[Optional[dict], Optional[str]]:
+    """Calculate one file's complexity metrics, reading it unless given content.
+
+    Runs in worker processes, so failures are returned rather than raised:
+    the result is (metrics, None) or (None, error).
+    """
+    file_path = Path(path_str)
+    try:
+        if content is None:
+            content = file_path.read_text(encoding="utf-8", errors="ignore")
+        metrics = PerformanceAnalyzer(None).calculate_complexity_metrics(
+            content, file_path, tree=tree, file_size=file_size
+        )
+    except Exception as e:
+        return None, str(e)
+    return metrics, None
 
 
 class PerformanceAnalyzer:
@@ -72,37 +414,61 @@ class PerformanceAnalyzer:
         self.analyzer = analyzer
         self.performance_metrics = {}
 
-    def analyze_performance_hotspots(self, python_files: List[Path]) -> None:
-        """Analyze performance characteristics of Python modules."""
+    def analyze_performance_hotspots(
+        self,
+        python_files: List[Path],
+        file_metrics: Optional[List[tuple]] = None,
+    ) -> None:
+        """Analyze performance characteristics of Python modules.
+
+        file_metrics holds (metrics, error) for each file, as computed by
+        the analyzer's registry scan; without it every file is read and
+        measured here, one after another.
+        """
         print("🔥 Analyzing performance hotspots...")
 
         self.performance_metrics = {}
+        analyzed = []
 
-        for file_path in python_files:
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-                unique_id = self.analyzer.create_unique_id(file_path)
-
-                # Calculate basic complexity metrics
-                metrics = self.calculate_complexity_metrics(content, file_path)
-
-                # Calculate performance risk score (0-1)
-                performance_score = self.calculate_performance_score(metrics)
+        # Calculate basic complexity metrics unless the analyzer's registry
+        # scan already did
+        if file_metrics is None:
+            file_metrics = [file_complexity_metrics(str(path)) for path in python_files]
 
-                self.performance_metrics[unique_id] = {
-                    **metrics,
-                    "performance_score": performance_score,
-                    "is_hotspot": performance_score
-                    > 0.6,  # High performance risk threshold
-                }
-
-            except Exception as e:
-                print(f"⚠️ Error analyzing {file_path}: {e}")
+        for file_path, (metrics, error) in zip(python_files, file_metrics):
+            if metrics is None:
+                print(f"⚠️ Error analyzing {file_path}: {error}")
                 continue
-
-    def calculate_complexity_metrics(self, content: str, file_path: Path) -> dict:
-        """Calculate code complexity metrics."""
-        lines = content.split("\n")
+            analyzed.append((self.analyzer.create_unique_id(file_path), metrics))
+
+        # Calculate performance risk scores (0-1) for every file in one batch
+        scores = self.score_all([metrics for _, metrics in analyzed])
+
+        for (unique_id, metrics), performance_score in zip(analyzed, scores):
+            self.performance_metrics[unique_id] = {
+                **metrics,
+                "performance_score": performance_score,
+                "is_hotspot": performance_score
+                > 0.6,  # High performance risk threshold
+            }
+
+    def calculate_complexity_metrics(
+        self,
+        content: Union[str, bytes],
+        file_path: Path,
+        tree: Optional[ast.AST] = None,
+        file_size: Optional[int] = None,
+    ) -> dict:
+        """Calculate code complexity metrics.
+
+        Content may be raw bytes, which ast.parse decodes itself, so callers
+        holding the file's bytes need not decode them first. Callers that
+        already parsed the content pass its tree to skip a second parse,
+        and callers that know the file's size in bytes pass it to skip a
+        stat.
+        """
+        newline, comment = (b"\n", b"#") if isinstance(content, bytes) else ("\n", "#")
+        lines = content.split(newline)
 
         # Basic metrics
         total_lines = len(lines)
@@ -110,72 +476,68 @@ class PerformanceAnalyzer:
             [
                 line
                 for line in lines
-                if line.strip() and not line.strip().startswith("#")
+                if line.strip() and not line.strip().startswith(comment)
             ]
         )
 
+        if tree is None:
+            try:
+                tree = ast.parse(content)
+            except (SyntaxError, ValueError):
+                pass
+
+        if tree is None:
+            if isinstance(content, bytes):
+                content = content.decode("utf-8", errors="ignore")
+            counters = self.calculate_text_metrics(content)
+        else:
+            visitor = ComplexityVisitor()
+            visitor.visit(tree)
+            counters = {
+                "function_count": visitor.function_count,
+                "class_count": visitor.class_count,
+                "cyclomatic_complexity": visitor.cyclomatic_complexity,
+                "heavy_operations": visitor.heavy_operations,
+                "max_nesting_depth": visitor.max_nesting_depth,
+            }
+
+        # File size factor
+        if file_size is None:
+            file_size = file_path.stat().st_size if file_path.exists() else 0
+        file_size_kb = file_size / 1024
+
+        return {
+            "total_lines": total_lines,
+            "code_lines": code_lines,
+            **counters,
+            "file_size_kb": file_size_kb,
+        }
+
+    def calculate_text_metrics(self, content: str) -> dict:
+        """Estimate complexity counters with text scans for unparsable files."""
         # Count functions and classes
-        function_count = len(re.findall(r"^\s*def\s+\w+", content, re.MULTILINE))
-        class_count = len(re.findall(r"^\s*class\s+\w+", content, re.MULTILINE))
+        function_count = len(FUNCTION_DEF_RE.findall(content))
+        class_count = len(CLASS_DEF_RE.findall(content))
 
         # Calculate cyclomatic complexity approximation
-        complexity_indicators = [
-            "if ",
-            "elif ",
-            "else:",
-            "for ",
-            "while ",
-            "try:",
-            "except",
-            "and ",
-            "or ",
-            "?",
-            "break",
-            "continue",
-        ]
         cyclomatic_complexity = sum(
-            content.count(indicator) for indicator in complexity_indicators
+            content.count(indicator) for indicator in COMPLEXITY_INDICATORS
         )
 
         # Look for performance-heavy patterns
-        heavy_patterns = [
-            r"\.read\(\)",
-            r"\.write\(\)",
-            r"\.open\(",
-            r"subprocess\.",
-            r"requests\.",
-            r"urllib\.",
-            r"json\.load",
-            r"pickle\.load",
-            r"pandas\.",
-            r"numpy\.",
-            r"scipy\.",
-            r"matplotlib\.",
-            r"for.*in.*range\(.*\d{3,}",
-            r"while.*True:",
-            r"time\.sleep",
-        ]
-
         heavy_operations = sum(
-            len(re.findall(pattern, content, re.IGNORECASE))
-            for pattern in heavy_patterns
+            len(pattern.findall(content)) for pattern in HEAVY_PATTERNS
         )
 
         # Calculate nesting depth
         max_nesting = self.calculate_max_nesting_depth(content)
 
-        # File size factor
-        file_size_kb = file_path.stat().st_size / 1024 if file_path.exists() else 0
-
         return {
-            "total_lines": total_lines,
-            "code_lines": code_lines,
             "function_count": function_count,
             "class_count": class_count,
             "cyclomatic_complexity": cyclomatic_complexity,
             "heavy_operations": heavy_operations,
             "max_nesting_depth": max_nesting,
-            "file_size_kb": file_size_kb,
         }
 
     def calculate_max_nesting_depth(self, content: str) -> int:
@@ -194,18 +556,7 @@ class PerformanceAnalyzer:
             indent_level = leading_spaces // 4
 
             # Update depth tracking
-            if any(
-                keyword in stripped
-                for keyword in [
-                    "if ",
-                    "for ",
-                    "while ",
-                    "def ",
-                    "class ",
-                    "with ",
-                    "try:",
-                ]
-            ):
+            if any(keyword in stripped for keyword in NESTING_KEYWORDS):
                 current_depth = indent_level + 1
                 max_depth = max(max_depth, current_depth)
 
@@ -213,13 +564,36 @@ class PerformanceAnalyzer:
 
     def calculate_performance_score(self, metrics: dict) -> float:
         """Calculate overall performance risk score (0-1)."""
-        # Weighted scoring based on different factors
-        factors = {
-            "complexity": min(metrics["cyclomatic_complexity"] / 100, 1.0) * 0.3,
-            "size": min(metrics["file_size_kb"] / 50, 1.0) * 0.2,  # Files over 50KB
-            "heavy_ops": min(metrics["heavy_operations"] / 10, 1.0) * 0.25,
-            "nesting": min(metrics["max_nesting_depth"] / 8, 1.0) * 0.15,
-            "function_density": min(metrics["function_count"] / 20, 1.0) * 0.1,
-        }
+        return performance_score_kernel(
+            metrics["cyclomatic_complexity"],
+            metrics["file_size_kb"],
+            metrics["heavy_operations"],
+            metrics["max_nesting_depth"],
+            metrics["function_count"],
+        )
+
+    def score_all(self, metrics_list: List[dict]) -> List[float]:
+        """Calculate performance risk scores for many files at once.
+
+        With numpy available the metrics are packed into one column per
+        factor and scored in a single vectorized expression; otherwise each
+        file is scored with calculate_performance_score.
+        """
+        if np is None or not metrics_list:
+            return [self.calculate_performance_score(m) for m in metrics_list]
+
+        def column(key):
+            return np.fromiter(
+                (m[key] for m in metrics_list),
+                dtype=np.float64,
+                count=len(metrics_list),
+            )
 
-        return sum(factors.values())
+        scores = performance_score_kernel(
+            column("cyclomatic_complexity"),
+            column("file_size_kb"),
+            column("heavy_operations"),
+            column("max_nesting_depth"),
+            column("function_count"),
+        )
+        return scores.tolist()
@@ -16,20 +16,34 @@ Dependencies:
 - subprocess: For executing git commands
 - datetime: For timestamp handling
 - pathlib: For path operations
+
+The combined analysis is cached per repository, keyed by the HEAD commit
+and the start of the analysis window, so repeated runs on the same commit
+on the same day skip the git log calls entirely.
 """
 
+import hashlib
+import json
+import os
 import subprocess
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+# Combined analyses kept between runs, next to the other depgraph caches
+GIT_CACHE_DIR = Path(tempfile.gettempdir()) / "depgraph-cache"
+# Bump whenever the analysis would produce different results for a commit
+GIT_CACHE_VERSION = 1
 
 
 class GitAnalyzer:
     """Analyzes git repository for change patterns and file modification frequency."""
 
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", use_cache: bool = True):
         """Initialize git analyzer for the specified repository."""
         self.repo_path = Path(repo_path).resolve()
+        self.use_cache = use_cache
         self.is_git_available = self._check_git_availability()
 
     def _check_git_availability(self) -> bool:
@@ -46,6 +60,20 @@ class GitAnalyzer:
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
 
+    def get_head_sha(self) -> Optional[str]:
+        """Return the commit HEAD points at, or None if there is none."""
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                cwd=self.repo_path,
+                timeout=10,
+            )
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+
     def get_file_change_frequency(self, days: int = 30) -> Dict[str, Dict[str, Any]]:
         """
         Analyze file change frequency over the specified number of days.
@@ -310,6 +338,19 @@ class GitAnalyzer:
         """
         print(f"🔄 Analyzing git history for the last {days} days...")
 
+        # git log only sees commits reachable from HEAD, and the window
+        # starts on a calendar day, so both together determine the result
+        cache_key = None
+        if self.use_cache and self.is_git_available:
+            head = self.get_head_sha()
+            since_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+            if head:
+                cache_key = [GIT_CACHE_VERSION, head, since_date, days]
+                cached = self._load_cached_analysis(cache_key)
+                if cached is not None:
+                    print("⚡ HEAD unchanged - reusing cached git analysis")
+                    return cached
+
         frequency_data = self.get_file_change_frequency(days)
         churn_data = self.get_file_churn_analysis(days)
 
@@ -338,8 +379,38 @@ class GitAnalyzer:
         print(
             f"✅ Git analysis complete - found {len(combined_data)} files with changes"
         )
+        if cache_key is not None:
+            self._store_cached_analysis(cache_key, analysis_summary)
         return analysis_summary
 
+    def _cache_path(self) -> Path:
+        """Return the analysis cache file for this repository."""
+        repo_digest = hashlib.blake2b(
+            str(self.repo_path).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        return GIT_CACHE_DIR / f"git-{repo_digest}.json"
+
+    def _load_cached_analysis(self, cache_key: list) -> Optional[Dict[str, Any]]:
+        """Return the cached combined analysis if it was stored under cache_key."""
+        try:
+            with open(self._cache_path(), "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cache.get("analysis") if cache.get("key") == cache_key else None
+
+    def _store_cached_analysis(self, cache_key: list, analysis: Dict[str, Any]) -> None:
+        """Atomically replace the cached analysis; failures are only reported."""
+        cache_path = self._cache_path()
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            GIT_CACHE_DIR.mkdir(exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": cache_key, "analysis": analysis}, f)
+            os.replace(temp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ Could not write git analysis cache {cache_path}: {e}")
+
     def _calculate_hotspot_score(self, frequency_data: Dict, churn_data: Dict) -> float:
         """Calculate a combined hotspot score from frequency and churn data."""
         frequency_score = frequency_data.get("change_frequency_score", 0.0)
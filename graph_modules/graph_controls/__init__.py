@@ -11,16 +11,20 @@ Submodules:
 This module maintains the original API by combining both submodules.
 """
 
+import functools
+
 from .ui_controls import get_ui_controls_js
 from .event_handlers import get_event_handlers_js
 
 
+@functools.lru_cache(maxsize=None)
 def get_graph_controls_js() -> str:
     """
     Get JavaScript code for UI controls and event handling.
 
     This function maintains backward compatibility by combining both submodules
     into a single JavaScript string, exactly as the original module did.
+    The string is assembled once and reused by every later caller.
 
     Returns:
         str: JavaScript code for controls and interaction
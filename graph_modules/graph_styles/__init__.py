@@ -10,14 +10,19 @@ This module is split into:
 - layout_styles: Component layouts, animations, and responsive design
 """
 
+import functools
+
 from .base_styles import get_base_styles_css
 from .layout_styles import get_layout_styles_css
 
 
+@functools.lru_cache(maxsize=None)
 def get_styles() -> str:
     """
     Get the complete CSS styles for the dependency graph.
 
+    The combined stylesheet is built once; the legacy aliases below share it.
+
     Returns:
         str: Complete CSS code combining base and layout styles
     """
@@ -13,18 +13,22 @@ Submodules:
 This module maintains the original API by combining all submodules.
 """
 
+import functools
+
 from .core import get_core_visualization_js
 from .layouts import get_layouts_visualization_js
 from .interactions import get_interactions_visualization_js
 from .rendering import get_rendering_visualization_js
 
 
+@functools.lru_cache(maxsize=None)
 def get_graph_visualization_js() -> str:
     """
     Get JavaScript code for complete graph visualization functionality.
 
     This function maintains backward compatibility by combining all submodules
     into a single JavaScript string, exactly as the original module did.
+    The string is assembled once and reused by every later caller.
 
     Returns:
         str: Complete JavaScript code for graph rendering and utilities
@@ -6,16 +6,25 @@ HTML template assembly and main generation function.
 Combines all modules into the complete visualization HTML.
 """
 
+import hashlib
 import json
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any
 
+from .git_analysis import GitAnalyzer
 from .graph_styles import get_graph_styles
 from .graph_visualization import get_graph_visualization_js
 from .hierarchical_layout import get_hierarchical_layout_js
 from .force_directed_layout import get_force_directed_layout_js
 from .graph_controls import get_graph_controls_js
 
+try:
+    import orjson  # Optional: faster graph data serialization
+except ImportError:
+    orjson = None
+
 # Configuration for control panel card order and properties
 CARD_ORDER_CONFIG = [
     {
@@ -250,13 +259,12 @@ def render_control_panel_cards(project_maximums: Dict[str, Any]) -> str:
         "controls": render_controls_card,
     }
 
-    cards_html = ""
-    for card in CARD_ORDER_CONFIG:
-        card_id = card["id"]
-        if card_id in card_renderers:
-            cards_html += card_renderers[card_id]()
-
-    return cards_html
+    # Collect each card's markup and join once instead of growing a string
+    return "".join(
+        card_renderers[card["id"]]()
+        for card in CARD_ORDER_CONFIG
+        if card["id"] in card_renderers
+    )
 
 
 def get_html_head() -> str:
@@ -380,12 +388,32 @@ def calculate_project_maximums(graph_data: Dict[str, Any]) -> Dict[str, int]:
     }
 
 
-def generate_enhanced_html_visualization(graph_data: Dict[str, Any]) -> str:
+def serialize_graph_data(graph_data: Dict[str, Any]) -> str:
+    """Serialize graph data as JSON indented by two spaces.
+
+    Uses orjson when it is installed, which also accepts numpy arrays and
+    scalars; otherwise json.dumps.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            graph_data,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(graph_data, indent=2)
+
+
+def generate_enhanced_html_visualization(
+    graph_data: Dict[str, Any], graph_data_json: str = None
+) -> str:
     """
     Generate complete HTML visualization by assembling all modules.
 
     Args:
         graph_data: Complete graph data dictionary from dependency analyzer
+        graph_data_json: graph_data already serialized by serialize_graph_data,
+            to avoid serializing it again
 
     Returns:
         str: Complete HTML document with embedded visualization
@@ -407,9 +435,12 @@ def generate_enhanced_html_visualization(graph_data: Dict[str, Any]) -> str:
     html_head = get_html_head()
     html_body = get_html_body(project_maximums)  # Pass maximums to body generation
 
+    if graph_data_json is None:
+        graph_data_json = serialize_graph_data(graph_data)
+
     # Assemble complete HTML with dynamic values
     complete_html = html_head.format(styles=styles) + html_body.format(
-        graph_data_json=json.dumps(graph_data, indent=2),
+        graph_data_json=graph_data_json,
         visualization_js=visualization_js,
         hierarchical_layout_js=hierarchical_layout_js,
         force_directed_layout_js=force_directed_layout_js,
@@ -423,11 +454,65 @@ def generate_enhanced_html_visualization(graph_data: Dict[str, Any]) -> str:
     return complete_html
 
 
-def main(root_path: str = None):
+def get_output_dir() -> Path:
+    """Return the graph_output directory for the current working directory.
+
+    Creates the directory if it does not exist yet.
+    """
+    # Determine if we're in dependency_graph folder and adjust path accordingly
+    current_dir = Path.cwd()
+    if (
+        current_dir.name == "dependency_graph"
+        or (current_dir / "graph_modules").exists()
+    ):
+        output_dir = Path(
+            "graph_output"
+        )  # We're in dependency_graph folder, use relative path
+    else:
+        output_dir = (
+            Path("dependency_graph") / "graph_output"
+        )  # We're in root, use dependency_graph subfolder
+    output_dir.mkdir(exist_ok=True)
+    return output_dir
+
+
+def compute_input_digest(root_path: str, days: int = 30) -> str:
+    """Hash the generator sources and the state of the analyzed project.
+
+    The graph_modules sources are hashed by content; the analyzed project
+    by the path, size and mtime of the Python files the analyzer would
+    walk, which is cheap and changes whenever a file is edited. The git
+    analysis in the output depends on the project's HEAD commit and on a
+    window starting days before today, so both are hashed too. Equal
+    digests mean the generated output would be the same.
+    """
+    from .dependency_analyzer import EnhancedDependencyAnalyzer
+
+    digest = hashlib.blake2b(digest_size=16)
+    for source in sorted(Path(__file__).resolve().parent.rglob("*.py")):
+        digest.update(source.read_bytes())
+
+    root = os.path.abspath(root_path)
+    git_analyzer = GitAnalyzer(root, use_cache=False)
+    head = git_analyzer.get_head_sha() if git_analyzer.is_git_available else None
+    since_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    digest.update(f"{root}\n{head}\n{since_date}:{days}\n".encode("utf-8"))
+
+    # Same walk and folder exclusions as the analysis itself
+    for path in EnhancedDependencyAnalyzer()._walk_python_files(root):
+        stat = os.stat(path)
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def main(root_path: str = None, jobs: int = None, use_cache: bool = True):
     """Generate enhanced dependency graph with modular architecture.
 
     Args:
         root_path: Path to the root directory to analyze. If None, uses default logic.
+        jobs: Worker processes used to parse files. None uses every core;
+            1 parses serially, which is easier to debug.
+        use_cache: Reuse cached scans of files unchanged since the last run.
     """
     from .dependency_analyzer import EnhancedDependencyAnalyzer
 
@@ -438,36 +523,27 @@ def main(root_path: str = None):
     if root_path is None:
         # Use existing logic for backward compatibility
         print("📊 Analyzing with automatic root detection...")
-        analyzer = EnhancedDependencyAnalyzer()
+        analyzer = EnhancedDependencyAnalyzer(jobs=jobs, use_cache=use_cache)
         graph_data = analyzer.analyze_project()
     else:
         # Use the provided root path
         print(f"📊 Analyzing project at: {root_path}")
-        analyzer = EnhancedDependencyAnalyzer()
+        analyzer = EnhancedDependencyAnalyzer(jobs=jobs, use_cache=use_cache)
         graph_data = analyzer.analyze_project(root_path)
 
+    # Serialize the graph data once for both the HTML and the JSON file
+    graph_data_json = serialize_graph_data(graph_data)
+
     # Generate enhanced HTML visualization
     print("🎨 Generating modular visualization...")
-    html_content = generate_enhanced_html_visualization(graph_data)
+    html_content = generate_enhanced_html_visualization(graph_data, graph_data_json)
 
-    # Save files - determine if we're in dependency_graph folder and adjust path accordingly
-    current_dir = Path.cwd()
-    if (
-        current_dir.name == "dependency_graph"
-        or (current_dir / "graph_modules").exists()
-    ):
-        output_dir = Path(
-            "graph_output"
-        )  # We're in dependency_graph folder, use relative path
-    else:
-        output_dir = (
-            Path("dependency_graph") / "graph_output"
-        )  # We're in root, use dependency_graph subfolder
-    output_dir.mkdir(exist_ok=True)
+    # Save files
+    output_dir = get_output_dir()
 
     # Save enhanced graph data
-    with open(output_dir / "enhanced_graph_data.json", "w") as f:
-        json.dump(graph_data, f, indent=2)
+    with open(output_dir / "enhanced_graph_data.json", "w", encoding="utf-8") as f:
+        f.write(graph_data_json)
 
     # Save enhanced HTML
     with open(
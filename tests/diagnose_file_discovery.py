@@ -7,8 +7,30 @@ This script tests the file discovery logic to understand why the dependency anal
 is not finding Python files in the graph_modules directory.
 """
 
+import os
 from pathlib import Path
 
+# Folders the analyzer skips; the walk below never descends into them
+EXCLUDE_FOLDERS = {"__pycache__", "dependency_graph"}
+
+
+def walk_py(root, skip=EXCLUDE_FOLDERS):
+    """Yield the paths of Python files under root, pruning skipped folders.
+
+    An iterative os.scandir walk reuses the directory entry type from
+    readdir instead of stat-ing every file and building a Path for it.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+
 
 def test_file_discovery():
     """Test file discovery in various directories."""
@@ -53,17 +75,13 @@ def test_file_discovery():
             print("   ❌ Permission denied")
             continue
 
-        # Find Python files using rglob
+        # Find Python files, skipping excluded folders on the way down
         try:
-            python_files = list(root.rglob("*.py"))
+            python_files = list(walk_py(root))
             print(f"   🐍 Found {len(python_files)} Python files:")
 
             for py_file in python_files[:10]:  # Show first 10
-                try:
-                    rel_path = py_file.relative_to(root)
-                    print(f"      {rel_path}")
-                except ValueError:
-                    print(f"      {py_file} (outside root)")
+                print(f"      {os.path.relpath(py_file, root)}")
 
             if len(python_files) > 10:
                 print(f"      ... and {len(python_files) - 10} more")
@@ -77,9 +95,6 @@ def test_exclusion_logic():
     print("\n🚫 Testing Exclusion Logic")
     print("=" * 50)
 
-    # Test exclusion patterns
-    exclude_folders = ["__pycache__", "dependency_graph"]
-
     test_files = [
         Path("graph_modules/__init__.py"),
         Path("graph_modules/dependency_analyzer/__init__.py"),
@@ -89,7 +104,7 @@ def test_exclusion_logic():
     ]
 
     for test_file in test_files:
-        excluded = any(excluded in test_file.parts for excluded in exclude_folders)
+        excluded = any(part in EXCLUDE_FOLDERS for part in test_file.parts)
         status = "❌ EXCLUDED" if excluded else "✅ INCLUDED"
         print(f"   {status} {test_file}")
 
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Validation Helpers
+==================
+
+Shared helpers and fixtures for the validation scripts that check generated
+JavaScript, CSS and HTML for expected markers.
+"""
+
+import copy
+import io
+import sys
+import threading
+from contextlib import contextmanager, redirect_stdout
+
+# Minimal graph the scripts generate their HTML under test from; callers get
+# a copy through mock_graph_data() so no script can change what others see
+_MOCK_GRAPH_DATA = {
+    "nodes": [
+        {
+            "id": "test_file.py",
+            "name": "test_file",
+            "folder": "root",
+            "size": 5120,
+            "total_lines": 120,
+            "performance_score": 0.75,
+            "is_test": False,
+        }
+    ],
+    "edges": [],
+    "subfolder_info": {"root": {"count": 1}},
+}
+
+
+def mock_graph_data():
+    """Return a fresh deep copy of the shared mock graph."""
+    return copy.deepcopy(_MOCK_GRAPH_DATA)
+
+
+@contextmanager
+def buffered_stdout():
+    """Collect everything printed inside the block and write it out once."""
+    stdout = sys.stdout
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield buffer
+    finally:
+        stdout.write(buffer.getvalue())
+        stdout.flush()
+
+
+class ThreadOutput(io.TextIOBase):
+    """Stand-in for sys.stdout that gives each capturing thread its own buffer.
+
+    Writes from a thread inside capture() go to that thread's buffer; all
+    other writes pass through to the wrapped stream. This lets validators
+    run concurrently while their output is still printed in order.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        return getattr(self._local, "buffer", self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    @contextmanager
+    def capture(self):
+        """Collect this thread's output in a StringIO for the duration."""
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            del self._local.buffer